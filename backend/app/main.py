@@ -864,8 +864,7 @@ async def websocket_verify_endpoint(websocket: WebSocket, session_id: str):
             # a representative sample for liveness/emotion/deepfake scoring
             max_pipeline_frames = 60  # ~2 seconds worth at 30fps, spread across all challenges
             if len(all_video_frames) > max_pipeline_frames:
-                import numpy as np_sample
-                indices = np_sample.linspace(0, len(all_video_frames) - 1, max_pipeline_frames, dtype=int)
+                indices = np.linspace(0, len(all_video_frames) - 1, max_pipeline_frames, dtype=int)
                 pipeline_frames = [all_video_frames[i] for i in indices]
                 logger.info(f"Subsampled {len(all_video_frames)} frames to {len(pipeline_frames)} for final pipeline")
             else:
@@ -1128,6 +1127,21 @@ async def websocket_verify_endpoint(websocket: WebSocket, session_id: str):
         session_manager.terminate_session(session_id, "error")
 
 
+def _jsonify(obj):
+    """Recursively convert numpy float32/int types to Python native types."""
+    if isinstance(obj, dict):
+        return {k: _jsonify(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonify(v) for v in obj]
+    if isinstance(obj, (np.floating, np.float32, np.float64)):
+        return float(obj)
+    if isinstance(obj, (np.integer, np.int32, np.int64)):
+        return int(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return obj
+
+
 async def _send_feedback(
     websocket: WebSocket,
     feedback_type: FeedbackType,
@@ -1150,21 +1164,6 @@ async def _send_feedback(
     )
     
     # Convert to JSON-serializable format
-    # Recursively convert numpy float32/int types to Python native types
-    import numpy as _np
-    def _jsonify(obj):
-        if isinstance(obj, dict):
-            return {k: _jsonify(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple)):
-            return [_jsonify(v) for v in obj]
-        if isinstance(obj, (_np.floating, _np.float32, _np.float64)):
-            return float(obj)
-        if isinstance(obj, (_np.integer, _np.int32, _np.int64)):
-            return int(obj)
-        if isinstance(obj, _np.ndarray):
-            return obj.tolist()
-        return obj
-
     feedback_dict = {
         "type": feedback.type.value,
         "message": feedback.message,
@@ -1317,7 +1316,7 @@ async def blockchain_verify():
     """
     Verify the entire blockchain integrity.
     
-    Checks hash linkage, block hashes, and RSA signatures.
+    Checks hash linkage, block hashes, and block signatures.
     Returns whether the chain is valid and any errors found.
     """
     result = blockchain_ledger.verify_chain_integrity()
@@ -1375,8 +1374,8 @@ async def blockchain_public_key():
         status_code=200,
         content={
             "public_key": blockchain_ledger.get_public_key_pem(),
-            "algorithm": "RSA-PSS with SHA-256",
-            "key_size": 2048,
+            "algorithm": blockchain_ledger.signature_algorithm,
+            "key_size": blockchain_ledger.key_size,
             "usage": "Verify block signatures in the verification ledger",
         },
     )
@@ -5,7 +5,7 @@ Implements a hash-chain (blockchain-like) ledger for all verification results.
 Each verification event is stored as a "block" with:
   - SHA-256 hash of previous block (immutable chain)
   - Verification data (scores, user_id, session_id)
-  - Cryptographic proof (signed with server's RSA private key)
+  - Cryptographic proof (signed with server's Ed25519 or RSA private key)
   - Timestamp and nonce for uniqueness
 
 This provides:
@@ -25,12 +25,23 @@ import logging
 from dataclasses import dataclass, field, asdict
 from typing import List, Optional, Dict, Any
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa, padding, utils
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa, padding, utils
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidSignature
 
 logger = logging.getLogger(__name__)
 
+# Canonical block serializer, built once; json.dumps constructs a new
+# encoder on every call when given non-default options
+_canonical_json = json.JSONEncoder(sort_keys=True, default=str).encode
+
+# RSA-PSS parameters for ledgers signed with an RSA key
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.MAX_LENGTH,
+)
+_PSS_HASH = hashes.SHA256()
+
 
 @dataclass
 class Block:
@@ -54,8 +65,7 @@ class Block:
             "data": self.data,
             "nonce": self.nonce,
         }
-        block_string = json.dumps(block_content, sort_keys=True, default=str)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return hashlib.sha256(_canonical_json(block_content).encode()).hexdigest()
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -69,7 +79,9 @@ class BlockchainLedger:
     """
     Decentralized verification blockchain ledger.
 
-    Maintains a hash-chain of all verification events with RSA signatures.
+    Maintains a hash-chain of all verification events with digital signatures.
+    Newly generated keys are Ed25519; RSA keys passed in or loaded from disk
+    keep signing with RSA-PSS so existing ledgers stay verifiable.
     Supports independent verification of any block or the entire chain.
     Persists to disk for durability across restarts.
     """
@@ -81,11 +93,15 @@ class BlockchainLedger:
     def __init__(self, private_key=None, public_key=None, storage_dir: str = None):
         self._lock = threading.Lock()
         self.chain: List[Block] = []
+        # Query indexes, filled as blocks are appended or loaded
+        self._by_id: Dict[str, Block] = {}
+        self._by_session: Dict[str, List[Block]] = {}
+        self._by_user: Dict[str, List[Block]] = {}
         self.storage_dir = storage_dir or os.path.join(
             os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data"
         )
 
-        # Initialize RSA key pair for block signing
+        # Initialize key pair for block signing
         if private_key and public_key:
             self._private_key = serialization.load_pem_private_key(
                 private_key.encode() if isinstance(private_key, str) else private_key,
@@ -101,11 +117,7 @@ class BlockchainLedger:
             loaded = self._load_keys()
             if not loaded:
                 # Generate new key pair and persist it
-                self._private_key = rsa.generate_private_key(
-                    public_exponent=65537,
-                    key_size=2048,
-                    backend=default_backend(),
-                )
+                self._private_key = ed25519.Ed25519PrivateKey.generate()
                 self._public_key = self._private_key.public_key()
                 self._save_keys()
 
@@ -139,10 +151,77 @@ class BlockchainLedger:
         genesis.block_hash = genesis.compute_hash()
         genesis.signature = self._sign_block(genesis)
         self.chain.append(genesis)
+        self._index_block(genesis)
         self._save_chain()
         logger.info("Genesis block created")
         return genesis
 
+    def _verification_data(
+        self,
+        session_id: str,
+        user_id: str,
+        verification_score: float,
+        liveness_score: float,
+        emotion_score: float,
+        deepfake_score: float,
+        passed: bool,
+        challenge_results: Optional[List[Dict]] = None,
+        token_id: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """Build the data payload of a verification result block."""
+        data = {
+            "type": "verification_result",
+            "session_id": session_id,
+            "user_id": user_id,
+            "scores": {
+                "liveness": round(liveness_score, 4),
+                "emotion": round(emotion_score, 4),
+                "deepfake": round(deepfake_score, 4),
+                "final": round(verification_score, 4),
+            },
+            "passed": passed,
+            "threshold": 0.65,
+            "timestamp_utc": time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime()
+            ),
+        }
+
+        if challenge_results:
+            data["challenges"] = challenge_results
+        if token_id:
+            data["token_id"] = token_id
+        if metadata:
+            data["metadata"] = metadata
+        return data
+
+    def _append_block(self, data: Dict[str, Any]) -> Block:
+        """Hash, sign and append a block after the current tip. Caller holds the lock."""
+        previous_block = self.chain[-1]
+        block = Block(
+            index=previous_block.index + 1,
+            timestamp=time.time(),
+            block_id=str(uuid.uuid4()),
+            previous_hash=previous_block.block_hash,
+            data=data,
+            nonce=uuid.uuid4().hex,
+        )
+        block.block_hash = block.compute_hash()
+        block.signature = self._sign_block(block)
+        self.chain.append(block)
+        self._index_block(block)
+        return block
+
+    def _index_block(self, block: Block):
+        """Add a block to the id, session and user query indexes."""
+        self._by_id[block.block_id] = block
+        session_id = block.data.get("session_id")
+        if session_id is not None:
+            self._by_session.setdefault(session_id, []).append(block)
+        user_id = block.data.get("user_id")
+        if user_id is not None:
+            self._by_user.setdefault(user_id, []).append(block)
+
     def add_verification_block(
         self,
         session_id: str,
@@ -162,44 +241,20 @@ class BlockchainLedger:
         Returns the newly created Block with its hash and signature.
         """
         with self._lock:
-            previous_block = self.chain[-1]
-
-            data = {
-                "type": "verification_result",
-                "session_id": session_id,
-                "user_id": user_id,
-                "scores": {
-                    "liveness": round(liveness_score, 4),
-                    "emotion": round(emotion_score, 4),
-                    "deepfake": round(deepfake_score, 4),
-                    "final": round(verification_score, 4),
-                },
-                "passed": passed,
-                "threshold": 0.65,
-                "timestamp_utc": time.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ", time.gmtime()
-                ),
-            }
-
-            if challenge_results:
-                data["challenges"] = challenge_results
-            if token_id:
-                data["token_id"] = token_id
-            if metadata:
-                data["metadata"] = metadata
-
-            block = Block(
-                index=previous_block.index + 1,
-                timestamp=time.time(),
-                block_id=str(uuid.uuid4()),
-                previous_hash=previous_block.block_hash,
-                data=data,
-                nonce=uuid.uuid4().hex,
+            block = self._append_block(
+                self._verification_data(
+                    session_id=session_id,
+                    user_id=user_id,
+                    verification_score=verification_score,
+                    liveness_score=liveness_score,
+                    emotion_score=emotion_score,
+                    deepfake_score=deepfake_score,
+                    passed=passed,
+                    challenge_results=challenge_results,
+                    token_id=token_id,
+                    metadata=metadata,
+                )
             )
-            block.block_hash = block.compute_hash()
-            block.signature = self._sign_block(block)
-
-            self.chain.append(block)
             self._save_chain()
 
             logger.info(
@@ -208,6 +263,34 @@ class BlockchainLedger:
             )
             return block
 
+    def add_verification_blocks_bulk(self, payloads: List[Dict[str, Any]]) -> List[Block]:
+        """
+        Add several verification result blocks in a single locked section.
+
+        Each payload holds add_verification_block's keyword arguments. Every
+        block is still hashed and signed individually, but the ledger file
+        is written once for the whole batch instead of once per block.
+
+        All payloads are validated before the first block is appended, so a
+        bad payload leaves the chain untouched.
+        """
+        batch = [self._verification_data(**payload) for payload in payloads]
+        with self._lock:
+            blocks = []
+            try:
+                for data in batch:
+                    blocks.append(self._append_block(data))
+            finally:
+                # Keep the ledger file in step with whatever reached the chain
+                if blocks:
+                    self._save_chain()
+            if blocks:
+                logger.info(
+                    f"Blocks #{blocks[0].index}-#{blocks[-1].index} added "
+                    f"({len(blocks)} verification results)"
+                )
+            return blocks
+
     def add_token_block(
         self,
         session_id: str,
@@ -219,8 +302,6 @@ class BlockchainLedger:
     ) -> Block:
         """Add a token issuance event to the chain."""
         with self._lock:
-            previous_block = self.chain[-1]
-
             data = {
                 "type": "token_issuance",
                 "session_id": session_id,
@@ -234,18 +315,7 @@ class BlockchainLedger:
                 ),
             }
 
-            block = Block(
-                index=previous_block.index + 1,
-                timestamp=time.time(),
-                block_id=str(uuid.uuid4()),
-                previous_hash=previous_block.block_hash,
-                data=data,
-                nonce=uuid.uuid4().hex,
-            )
-            block.block_hash = block.compute_hash()
-            block.signature = self._sign_block(block)
-
-            self.chain.append(block)
+            block = self._append_block(data)
             self._save_chain()
 
             logger.info(
@@ -258,32 +328,28 @@ class BlockchainLedger:
     # ------------------------------------------------------------------
 
     def _sign_block(self, block: Block) -> str:
-        """Sign a block's hash with the RSA private key."""
+        """Sign a block's hash with the ledger's private key."""
         hash_bytes = block.block_hash.encode()
-        signature = self._private_key.sign(
-            hash_bytes,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
+        if isinstance(self._private_key, rsa.RSAPrivateKey):
+            signature = self._private_key.sign(hash_bytes, _PSS_PADDING, _PSS_HASH)
+        else:
+            signature = self._private_key.sign(hash_bytes)
         return signature.hex()
 
     def verify_block_signature(self, block: Block) -> bool:
-        """Verify a block's RSA signature using the public key."""
+        """Verify a block's signature using the public key."""
         try:
             signature_bytes = bytes.fromhex(block.signature)
             hash_bytes = block.block_hash.encode()
-            self._public_key.verify(
-                signature_bytes,
-                hash_bytes,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
+            if isinstance(self._public_key, rsa.RSAPublicKey):
+                self._public_key.verify(
+                    signature_bytes,
+                    hash_bytes,
+                    _PSS_PADDING,
+                    _PSS_HASH,
+                )
+            else:
+                self._public_key.verify(signature_bytes, hash_bytes)
             return True
         except (InvalidSignature, ValueError, Exception):
             return False
@@ -299,7 +365,7 @@ class BlockchainLedger:
         Checks:
         1. Each block's hash matches its content
         2. Each block's previous_hash matches the prior block
-        3. Each block's RSA signature is valid
+        3. Each block's signature is valid
         4. Genesis block has correct previous_hash
 
         Returns a dict with 'valid', 'block_count', and any 'errors'.
@@ -400,26 +466,16 @@ class BlockchainLedger:
 
     def get_block_by_id(self, block_id: str) -> Optional[Dict]:
         """Get a block by its unique block_id."""
-        for b in self.chain:
-            if b.block_id == block_id:
-                return b.to_dict()
-        return None
+        block = self._by_id.get(block_id)
+        return block.to_dict() if block else None
 
     def get_blocks_by_session(self, session_id: str) -> List[Dict]:
         """Get all blocks related to a specific session."""
-        return [
-            b.to_dict()
-            for b in self.chain
-            if b.data.get("session_id") == session_id
-        ]
+        return [b.to_dict() for b in self._by_session.get(session_id, [])]
 
     def get_blocks_by_user(self, user_id: str) -> List[Dict]:
         """Get all blocks related to a specific user."""
-        return [
-            b.to_dict()
-            for b in self.chain
-            if b.data.get("user_id") == user_id
-        ]
+        return [b.to_dict() for b in self._by_user.get(user_id, [])]
 
     def get_latest_blocks(self, count: int = 10) -> List[Dict]:
         """Get the most recent N blocks."""
@@ -460,6 +516,18 @@ class BlockchainLedger:
             ),
         }
 
+    @property
+    def signature_algorithm(self) -> str:
+        """Name of the block signature scheme in use."""
+        if isinstance(self._public_key, rsa.RSAPublicKey):
+            return "RSA-PSS with SHA-256"
+        return "Ed25519"
+
+    @property
+    def key_size(self) -> int:
+        """Signing key size in bits."""
+        return getattr(self._public_key, "key_size", 256)
+
     def get_public_key_pem(self) -> str:
         """Export public key in PEM format for independent verification."""
         return self._public_key.public_bytes(
@@ -493,7 +561,7 @@ class BlockchainLedger:
                 "1": "Recompute block hash from block data (excluding hash & signature)",
                 "2": "Verify computed hash matches block_hash",
                 "3": "Verify previous_hash matches the prior block's hash",
-                "4": "Verify RSA-PSS signature using the provided public key",
+                "4": f"Verify {self.signature_algorithm} signature using the provided public key",
             },
             "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         }
@@ -525,6 +593,8 @@ class BlockchainLedger:
                 # Verify loaded chain integrity
                 result = self.verify_chain_integrity()
                 if result["valid"]:
+                    for block in self.chain:
+                        self._index_block(block)
                     logger.info(
                         f"Loaded {len(self.chain)} blocks from ledger file"
                     )
@@ -541,7 +611,7 @@ class BlockchainLedger:
         return False
 
     def _save_keys(self):
-        """Persist RSA key pair to disk so chain survives server restarts."""
+        """Persist the key pair to disk so chain survives server restarts."""
         try:
             os.makedirs(self.storage_dir, exist_ok=True)
             filepath = os.path.join(self.storage_dir, self.KEY_FILE)
@@ -558,7 +628,7 @@ class BlockchainLedger:
             logger.error(f"Failed to save ledger keys: {e}")
 
     def _load_keys(self) -> bool:
-        """Load persisted RSA keys from disk. Returns True if loaded."""
+        """Load persisted keys from disk. Returns True if loaded."""
         try:
             filepath = os.path.join(self.storage_dir, self.KEY_FILE)
             if os.path.exists(filepath):
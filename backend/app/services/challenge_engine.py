@@ -72,6 +72,19 @@ class ChallengeEngine:
         """
         return secrets.token_hex(16)  # 16 bytes = 32 hex characters
     
+    def generate_nonces(self, n: int) -> List[str]:
+        """
+        Generate several nonces from a single draw of random bytes.
+        
+        Args:
+            n: Number of nonces to generate
+            
+        Returns:
+            List[str]: n 32-character hexadecimal nonces
+        """
+        buf = secrets.token_bytes(16 * n)
+        return [buf[i:i + 16].hex() for i in range(0, 16 * n, 16)]
+    
     def generate_challenge_sequence(
         self, 
         session_id: str, 
@@ -3,11 +3,12 @@ Computer Vision Verifier for liveness detection and challenge verification
 """
 import cv2
 import logging
+import os
 import time
 import mediapipe as mp
 import numpy as np
 from typing import List, Optional
-from ..models.data_models import Challenge, ChallengeResult
+from ..models.data_models import Challenge, ChallengeResult, ChallengeType
 
 logger = logging.getLogger(__name__)
 
@@ -62,18 +63,15 @@ class CVVerifier:
         """
         if self._face_landmarker is None:
             if self.model_path is None:
-                import logging
-                logging.getLogger(__name__).warning(
+                logger.warning(
                     "Model path not provided. Face landmarker will not be available. "
                     "Download the model using: python download_mediapipe_model.py"
                 )
                 return None
             
             try:
-                import os
                 if not os.path.exists(self.model_path):
-                    import logging
-                    logging.getLogger(__name__).warning(
+                    logger.warning(
                         f"MediaPipe model not found at {self.model_path}. "
                         "Download it using: python download_mediapipe_model.py"
                     )
@@ -98,8 +96,7 @@ class CVVerifier:
                 # Create FaceLandmarker
                 self._face_landmarker = mp.tasks.vision.FaceLandmarker.create_from_options(options)
             except Exception as e:
-                import logging
-                logging.getLogger(__name__).error(f"Failed to initialize MediaPipe FaceLandmarker: {e}")
+                logger.error(f"Failed to initialize MediaPipe FaceLandmarker: {e}")
                 return None
         
         return self._face_landmarker
@@ -121,8 +118,12 @@ class CVVerifier:
             
         Validates Requirement 3.1
         """
-        # Resize frame to target size
-        resized = cv2.resize(frame, target_size, interpolation=cv2.INTER_LINEAR)
+        # Resize frame to target size (skipped when the webcam already
+        # delivers frames at that size, saving a full-frame copy)
+        if frame.shape[1] == target_size[0] and frame.shape[0] == target_size[1]:
+            resized = frame
+        else:
+            resized = cv2.resize(frame, target_size, interpolation=cv2.INTER_LINEAR)
         
         # Convert BGR to RGB (MediaPipe requires RGB)
         rgb_frame = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
@@ -278,8 +279,6 @@ class CVVerifier:
             )
         
         # Map human-readable instructions back to action keys
-        from ..models.data_models import ChallengeType
-        
         INSTRUCTION_TO_ACTION = {
             "Nod your head up": "nod_up",
             "Nod your head down": "nod_down",
@@ -9,12 +9,16 @@ import json
 import time
 import logging
 import threading
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
 from typing import List, Optional
 
 from app.models.data_models import Session, SessionStatus, ScoringResult
 
 logger = logging.getLogger(__name__)
 
+_by_timestamp = itemgetter("timestamp")
+
 
 class DatabaseService:
     """In-memory database service — no external dependencies required."""
@@ -26,6 +30,7 @@ class DatabaseService:
         self._tokens: dict = {}            # token_id -> dict
         self._nonces: dict = {}            # nonce -> dict
         self._audit_logs: list = []        # list of dicts
+        self._audit_logs_by_user: dict = {}  # user_id -> list of dicts sorted by timestamp (index)
         logger.info("DatabaseService initialized (in-memory store)")
 
     # -- Session operations --
@@ -136,29 +141,57 @@ class DatabaseService:
 
     # -- Audit log operations --
 
+    @staticmethod
+    def _audit_entry(log_id, session_id, user_id, event_type, timestamp, details):
+        """Build an audit log record, decoding JSON-string details"""
+        return {
+            "log_id": log_id,
+            "session_id": session_id,
+            "user_id": user_id,
+            "event_type": event_type,
+            "timestamp": timestamp,
+            "details": details if isinstance(details, dict) else json.loads(details) if details else None,
+        }
+
     def save_audit_log(self, log_id, session_id, user_id, event_type, timestamp, details):
         """Store audit log entry"""
+        entry = self._audit_entry(log_id, session_id, user_id, event_type, timestamp, details)
         with self._lock:
-            self._audit_logs.append({
-                "log_id": log_id,
-                "session_id": session_id,
-                "user_id": user_id,
-                "event_type": event_type,
-                "timestamp": timestamp,
-                "details": details if isinstance(details, dict) else json.loads(details) if details else None,
-            })
+            self._audit_logs.append(entry)
+            insort(self._audit_logs_by_user.setdefault(user_id, []), entry, key=_by_timestamp)
+
+    def save_audit_logs_bulk(self, logs):
+        """
+        Store several audit log entries under a single lock acquisition.
+
+        Each item is a dict with the same keys as save_audit_log's arguments.
+        """
+        entries = [self._audit_entry(**log) for log in logs]
+        with self._lock:
+            self._audit_logs.extend(entries)
+            for entry in entries:
+                insort(self._audit_logs_by_user.setdefault(entry["user_id"], []), entry, key=_by_timestamp)
 
     def get_audit_logs(self, user_id=None, start_time=None, end_time=None, limit=100):
-        """Retrieve audit records"""
+        """
+        Retrieve audit records in timestamp order; limit keeps the latest.
+
+        With user_id, results come from that user's timestamp-sorted index
+        and the time range is located by binary search.
+        """
         with self._lock:
-            logs = list(self._audit_logs)
-
-        if user_id:
-            logs = [l for l in logs if l.get("user_id") == user_id]
-        if start_time:
-            logs = [l for l in logs if l["timestamp"] >= start_time]
-        if end_time:
-            logs = [l for l in logs if l["timestamp"] <= end_time]
+            if user_id:
+                bucket = self._audit_logs_by_user.get(user_id, [])
+                lo = bisect_left(bucket, start_time, key=_by_timestamp) if start_time else 0
+                hi = bisect_right(bucket, end_time, key=_by_timestamp) if end_time else len(bucket)
+                logs = bucket[lo:hi]
+            else:
+                logs = [
+                    l for l in self._audit_logs
+                    if (not start_time or l["timestamp"] >= start_time)
+                    and (not end_time or l["timestamp"] <= end_time)
+                ]
+                logs.sort(key=_by_timestamp)
 
         return logs[-limit:]
 
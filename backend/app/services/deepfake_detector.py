@@ -24,9 +24,13 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass
 import logging
 import os
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Default MesoNet-4 weights location (see download_deepfake_model.py)
+MESONET_WEIGHTS_PATH = Path.home() / ".deepfake_models" / "mesonet4_weights.h5"
+
 
 @dataclass
 class DeepfakeAnalysisResult:
@@ -103,10 +107,9 @@ class DeepfakeDetector:
             self.model_type = "mesonet4"
             
             # Try to load pre-trained weights if available
-            weights_path = os.path.join(os.path.expanduser("~"), ".deepfake_models", "mesonet4_weights.h5")
-            if os.path.exists(weights_path):
+            if MESONET_WEIGHTS_PATH.is_file():
                 try:
-                    self.model.load_weights(weights_path)
+                    self.model.load_weights(str(MESONET_WEIGHTS_PATH))
                     self._model_has_trained_weights = True
                     logger.info("Loaded MesoNet-4 pre-trained weights")
                 except Exception as e:
@@ -476,12 +479,13 @@ class DeepfakeDetector:
         - Unnatural motion patterns
         
         Args:
-            frame_sequence: List of consecutive video frames
+            frame_sequence: List of consecutive video frames, or a stacked
+                (N, H, W, 3) array
             
         Returns:
             Temporal consistency score (0.0 = inconsistent, 1.0 = consistent)
         """
-        if not frame_sequence or len(frame_sequence) < 2:
+        if frame_sequence is None or len(frame_sequence) < 2:
             return 0.5  # Neutral score if insufficient frames
             
         consistency_scores = []
@@ -529,12 +533,12 @@ class DeepfakeDetector:
         spatial artifacts are consistent across the video.
         
         Args:
-            video_frames: List of video frames to analyze
+            video_frames: List of video frames, or a stacked (N, H, W, 3) array
             
         Returns:
             Authenticity score (0.0 = definitely fake, 1.0 = definitely real)
         """
-        if not video_frames:
+        if video_frames is None or len(video_frames) == 0:
             return 0.0
         
         # Subsample for spatial analysis — check every Nth frame
@@ -579,12 +583,12 @@ class DeepfakeDetector:
         signals that the session should be terminated.
         
         Args:
-            video_frames: List of video frames to analyze
+            video_frames: List of video frames, or a stacked (N, H, W, 3) array
             
         Returns:
             DeepfakeAnalysisResult with scores and termination flag
         """
-        if not video_frames:
+        if video_frames is None or len(video_frames) == 0:
             return DeepfakeAnalysisResult(
                 spatial_score=0.0,
                 temporal_score=0.0,
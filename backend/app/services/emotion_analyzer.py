@@ -162,66 +162,90 @@ class EmotionAnalyzer:
             # Need at least 2 frames to analyze transitions
             return 1.0
         
+        return self.verify_natural_transitions_batch(
+            np.array([e.dominant_emotion for e in emotion_sequence]),
+            np.array([e.confidence for e in emotion_sequence], dtype=np.float64)
+        )
+    
+    def verify_natural_transitions_batch(
+        self,
+        labels: np.ndarray,
+        confidences: np.ndarray
+    ) -> float:
+        """
+        Vectorized form of verify_natural_transitions over parallel arrays.
+        
+        Takes the emotion sequence as a structure of arrays (one label array
+        and one confidence array, index-aligned) so every frame-to-frame
+        check is a single NumPy pass instead of a Python loop over
+        EmotionResult attribute lookups.
+        
+        Args:
+            labels: Dominant emotion per frame, shape (N,)
+            confidences: Confidence per frame (0.0-1.0), shape (N,)
+            
+        Returns:
+            float: Transition naturalness score (0.0-1.0)
+            
+        Validates Requirements 6.2, 6.5
+        """
+        confidences = np.asarray(confidences, dtype=np.float64)
+        labels = np.asarray(labels)
+        if len(confidences) < 2:
+            # Need at least 2 frames to analyze transitions
+            return 1.0
+        
         # If all confidences are zero, DeepFace is unavailable or no face was
         # detected — return a neutral score instead of penalising.  Penalising
         # identical zero-confidence values would tank the emotion score for
         # perfectly legitimate users whose system lacks DeepFace.
-        all_confidences = [e.confidence for e in emotion_sequence]
-        if max(all_confidences) < 0.01:
+        if confidences.max() < 0.01:
             # DeepFace unavailable — can't measure transitions, return neutral
             return 0.7
         
-        # Track penalties for unnatural patterns
-        penalty = 0.0
-        max_penalty = 1.0
+        prev_conf = confidences[:-1]
+        curr_conf = confidences[1:]
+        confidence_change = np.abs(curr_conf - prev_conf)
+        total_pairs = len(confidence_change)
         
-        # Count how many frame pairs show suspicious patterns
-        rigid_count = 0
-        total_pairs = len(emotion_sequence) - 1
+        # Instantaneous emotion changes: if emotion changes AND confidence is
+        # high on both frames, the change is unnatural
+        instant_switches = np.count_nonzero(
+            (labels[:-1] != labels[1:]) & (prev_conf > 0.7) & (curr_conf > 0.7)
+        )
         
-        # Analyze frame-to-frame transitions
-        for i in range(1, len(emotion_sequence)):
-            prev = emotion_sequence[i - 1]
-            curr = emotion_sequence[i]
-            
-            # Check for instantaneous emotion changes
-            # If emotion changes AND confidence is high on both, it's suspicious
-            if prev.dominant_emotion != curr.dominant_emotion:
-                if prev.confidence > 0.7 and curr.confidence > 0.7:
-                    # High-confidence instantaneous change is unnatural
-                    penalty += 0.15
-            
-            # Track rigid patterns (identical confidence values)
-            # NOTE: Having similar confidence across frames IS natural for a
-            # person holding a steady expression. Only penalise if the entire
-            # sequence is perfectly identical (handled below).
-            if abs(prev.confidence - curr.confidence) < 0.001:
-                rigid_count += 1
-            
-            # Check for impossible confidence jumps
-            # Natural emotions don't go from 0.1 to 0.9 instantly
-            confidence_change = abs(curr.confidence - prev.confidence)
-            if confidence_change > 0.5:
-                penalty += 0.10
+        # Rigid pairs (identical confidence values)
+        # NOTE: Having similar confidence across frames IS natural for a
+        # person holding a steady expression. Only penalise if the entire
+        # sequence is perfectly identical (handled below).
+        rigid_count = np.count_nonzero(confidence_change < 0.001)
+        
+        # Impossible confidence jumps
+        # Natural emotions don't go from 0.1 to 0.9 instantly
+        confidence_jumps = np.count_nonzero(confidence_change > 0.5)
+        
+        penalty = 0.15 * instant_switches + 0.10 * confidence_jumps
+        max_penalty = 1.0
         
         # Check for overall rigidity across the sequence
         # Only penalise if a very high proportion of frames are perfectly
         # identical — a person naturally maintaining an expression will still
         # have small confidence fluctuations, but holding steady is NOT
         # suspicious by itself.
-        confidences = [e.confidence for e in emotion_sequence]
-        unique_confidences = len(set(round(c, 4) for c in confidences))
+        # Python's round() is correctly rounded; np.round scales first and
+        # disagrees at half-way values such as 0.12345
+        unique_confidences = len({round(c, 4) for c in confidences.tolist()})
         if unique_confidences == 1:
             # All confidences bit-for-bit identical = likely synthetic
             penalty += 0.25
-        elif total_pairs > 0 and rigid_count / total_pairs > 0.95:
+        elif rigid_count / total_pairs > 0.95:
             # >95% of pairs have near-identical confidence — mildly suspicious
             penalty += 0.10
         
         # Calculate final score (1.0 - normalized penalty)
         score = max(0.0, 1.0 - min(penalty, max_penalty))
         
-        return score
+        return float(score)
 
     
     def compute_emotion_score(
@@ -243,7 +267,8 @@ class EmotionAnalyzer:
         4. Combine signals into final score
         
         Args:
-            video_frames: List of video frames in BGR format (OpenCV default)
+            video_frames: List of video frames in BGR format (OpenCV default),
+                or a stacked (N, H, W, 3) array
             expected_emotion: Optional emotion to verify (for expression challenges)
             
         Returns:
@@ -253,7 +278,7 @@ class EmotionAnalyzer:
                   
         Validates Requirements 6.3
         """
-        if not video_frames or len(video_frames) == 0:
+        if video_frames is None or len(video_frames) == 0:
             # No frames to analyze
             return 0.0
         
@@ -264,34 +289,32 @@ class EmotionAnalyzer:
         if not self.deepface_available:
             return 0.70
         
-        # Step 1: Detect emotions in each frame
-        emotion_sequence = []
-        for frame in video_frames:
-            emotion_result = self.detect_emotion(frame)
-            emotion_sequence.append(emotion_result)
+        # Step 1: Detect emotions in each frame, kept as parallel
+        # label / confidence arrays for the vectorized checks below
+        emotion_sequence = [self.detect_emotion(frame) for frame in video_frames]
+        labels = np.array([e.dominant_emotion for e in emotion_sequence])
+        confidences = np.array([e.confidence for e in emotion_sequence], dtype=np.float64)
         
         # Step 2: Analyze transition naturalness
-        transition_score = self.verify_natural_transitions(emotion_sequence)
+        transition_score = self.verify_natural_transitions_batch(labels, confidences)
         
         # Step 3: Calculate average confidence across frames
-        avg_confidence = sum(e.confidence for e in emotion_sequence) / len(emotion_sequence)
+        avg_confidence = float(confidences.mean())
         
         # Step 4: If expected emotion is provided, verify it was detected
         emotion_match_score = 1.0
         if expected_emotion is not None:
-            # Check if the expected emotion appears in the sequence
-            detected_emotions = [e.dominant_emotion for e in emotion_sequence]
-            
             # Normalize emotion names (DeepFace uses 'surprise' not 'surprised')
             normalized_expected = expected_emotion.lower()
             if normalized_expected == 'surprised':
                 normalized_expected = 'surprise'
             
-            if normalized_expected in detected_emotions:
+            # Check if the expected emotion appears in the sequence
+            match_count = int(np.count_nonzero(labels == normalized_expected))
+            if match_count > 0:
                 # Expected emotion was detected
                 # Calculate what percentage of frames showed this emotion
-                match_count = detected_emotions.count(normalized_expected)
-                emotion_match_score = min(1.0, match_count / len(detected_emotions) * 2)
+                emotion_match_score = min(1.0, match_count / len(labels) * 2)
             else:
                 # Expected emotion was not detected
                 emotion_match_score = 0.0
@@ -6,9 +6,11 @@ proof-of-life verifications.
 """
 import os
 import time
+import json
+import base64
 import jwt
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.backends import default_backend
 from typing import Optional
 
@@ -37,9 +39,31 @@ class TokenIssuer:
         if private_key and public_key:
             self.private_key = private_key
             self.public_key = public_key
+            # Parse the PEMs once; PyJWT accepts key objects directly and
+            # would otherwise re-parse the PEM on every encode/decode
+            self._priv_obj = serialization.load_pem_private_key(
+                private_key.encode(),
+                password=None,
+                backend=default_backend()
+            )
+            self._pub_obj = serialization.load_pem_public_key(
+                public_key.encode(),
+                backend=default_backend()
+            )
         else:
             # Generate RSA key pair if not provided
             self._generate_key_pair()
+        
+        # The JWT header is identical for every token we issue, so encode
+        # it once instead of re-serializing it on each issuance
+        self._header_b64 = self._b64url(
+            json.dumps({"alg": self.ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+        )
+    
+    @staticmethod
+    def _b64url(data: bytes) -> bytes:
+        """Base64url-encode without padding, as required by RFC 7515."""
+        return base64.urlsafe_b64encode(data).rstrip(b"=")
     
     def _generate_key_pair(self) -> None:
         """Generate a new RSA key pair for signing tokens."""
@@ -49,6 +73,7 @@ class TokenIssuer:
             key_size=2048,
             backend=default_backend()
         )
+        self._priv_obj = private_key_obj
         
         # Serialize private key to PEM format
         self.private_key = private_key_obj.private_bytes(
@@ -59,6 +84,7 @@ class TokenIssuer:
         
         # Extract and serialize public key
         public_key_obj = private_key_obj.public_key()
+        self._pub_obj = public_key_obj
         self.public_key = public_key_obj.public_bytes(
             encoding=serialization.Encoding.PEM,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
@@ -99,13 +125,16 @@ class TokenIssuer:
             "iss": self.ISSUER
         }
         
-        token = jwt.encode(
-            payload,
-            self.private_key,
-            algorithm=self.ALGORITHM
+        # Sign "<header>.<payload>" with RS256 (PKCS#1 v1.5 + SHA-256),
+        # reusing the precomputed header segment
+        signing_input = self._header_b64 + b"." + self._b64url(
+            json.dumps(payload, separators=(",", ":")).encode()
         )
+        signature = self._priv_obj.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        
+        token = signing_input + b"." + self._b64url(signature)
         
-        return token
+        return token.decode("ascii")
     
     def validate_token(self, token: str) -> TokenValidation:
         """
@@ -127,7 +156,7 @@ class TokenIssuer:
             # Decode and verify token
             payload = jwt.decode(
                 token,
-                self.public_key,
+                self._pub_obj,
                 algorithms=[self.ALGORITHM],
                 issuer=self.ISSUER
             )
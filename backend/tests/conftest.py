@@ -0,0 +1,31 @@
+"""
+Shared pytest configuration
+
+Registers Hypothesis profiles; select one with the HYPOTHESIS_PROFILE
+environment variable (e.g. HYPOTHESIS_PROFILE=ci or HYPOTHESIS_PROFILE=dev).
+"""
+import os
+
+from hypothesis import settings, Phase
+
+# CI: reproducible example generation and no shrinking, so a flaky failure
+# reports the first counterexample instead of spending minutes minimizing it.
+# derandomize already replays the same examples each run, so there is no
+# example database to reuse
+settings.register_profile(
+    "ci",
+    phases=[Phase.explicit, Phase.generate],
+    derandomize=True,
+    deadline=None,
+)
+
+# Dev: a fast local loop. Only test_audit_logging.py has hand-picked
+# @example cases, so the generate phase stays on with a small budget;
+# otherwise every other @given test would run zero examples and pass
+settings.register_profile(
+    "dev",
+    phases=[Phase.explicit, Phase.generate],
+    max_examples=10,
+)
+
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
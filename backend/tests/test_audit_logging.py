@@ -1,16 +1,148 @@
 """
 Unit tests for audit logging functionality
 """
+import os
 import pytest
 import time
 import uuid
+from collections import defaultdict
 from fastapi.testclient import TestClient
+from hypothesis import given, example, target, assume, strategies as st, settings
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from app.main import app, database_service
+from app.models.data_models import ChallengeResult
+from app.services.challenge_engine import ChallengeEngine
+from app.services.scoring_engine import ScoringEngine
+from app.services.token_issuer import TokenIssuer
 
-client = TestClient(app)
+# Fields every stored verification result must carry
+REQUIRED_RESULT_FIELDS = frozenset({
+    "result_id", "session_id", "liveness_score", "deepfake_score",
+    "emotion_score", "final_score", "passed", "timestamp"
+})
 
 
-def test_session_start_audit_log():
+class AuditLogRecord(BaseModel):
+    """Schema every stored audit log entry must satisfy"""
+    model_config = ConfigDict(strict=True)
+
+    log_id: str = Field(min_length=1)
+    session_id: str = Field(min_length=1)
+    user_id: str = Field(min_length=1)
+    event_type: str = Field(min_length=1)
+    timestamp: float = Field(gt=0)
+    details: dict
+
+
+class SessionStartDetails(BaseModel):
+    """Required details of a session_start audit event"""
+    model_config = ConfigDict(strict=True)
+
+    start_time: float
+
+
+class ChallengeCompletionDetails(BaseModel):
+    """Required details of a challenge_completion audit event"""
+    challenge_id: Any
+    completed: Any
+
+
+class VerificationResultDetails(BaseModel):
+    """Required details of a verification_result audit event"""
+    liveness_score: Any
+    deepfake_score: Any
+    emotion_score: Any
+    final_score: Any
+    passed: Any
+
+
+class TokenIssuanceDetails(BaseModel):
+    """Required details of a token_issuance audit event"""
+    model_config = ConfigDict(strict=True)
+
+    token_id: Any
+    issued_at: float
+    expires_at: float
+
+    @model_validator(mode="after")
+    def _expires_after_issue(self):
+        if not self.expires_at > self.issued_at:
+            raise ValueError("expires_at must be after issued_at")
+        return self
+
+
+# event_type -> schema its details must satisfy
+EVENT_DETAIL_SCHEMAS = {
+    "session_start": SessionStartDetails,
+    "challenge_completion": ChallengeCompletionDetails,
+    "verification_result": VerificationResultDetails,
+    "token_issuance": TokenIssuanceDetails,
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Shared TestClient so app startup runs once per module"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def scoring_engine():
+    """Shared ScoringEngine; it only holds the weights and threshold"""
+    return ScoringEngine()
+
+
+@pytest.fixture(scope="module")
+def token_issuer():
+    """Shared TokenIssuer so the RSA key pair is generated once per module"""
+    return TokenIssuer()
+
+
+@pytest.fixture(scope="module")
+def challenge_engine():
+    """Shared ChallengeEngine"""
+    return ChallengeEngine()
+
+
+def _uuid_batch(n):
+    """Generate n random UUID strings from a single os.urandom read"""
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def _new_session(client, user_id):
+    """Start a verification session through the API and return its session_id"""
+    response = client.post("/api/auth/verify", json={"user_id": user_id})
+    assert response.status_code == 200
+    return response.json()["session_id"]
+
+
+@pytest.fixture(scope="module")
+def shared_session(client):
+    """
+    One session reused by property tests that only vary the scores.
+
+    Returns (user_id, session_id).
+    """
+    user_id = f"prop_test_{uuid.uuid4()}"
+    return user_id, _new_session(client, user_id)
+
+
+@pytest.fixture(scope="module")
+def timestamp_session(client):
+    """
+    Session shared by the event timestamp property's examples.
+
+    Returns (user_id, session_id, session_start_logs).
+    """
+    user_id = f"prop_test_{uuid.uuid4()}"
+    session_id = _new_session(client, user_id)
+    return user_id, session_id, database_service.get_audit_logs(user_id=user_id)
+
+
+def test_session_start_audit_log(client):
     """Test that session start creates an audit log entry"""
     user_id = f"test_user_{uuid.uuid4()}"
     
@@ -42,7 +174,7 @@ def test_session_start_audit_log():
     assert log["details"]["session_id"] == session_id
 
 
-def test_audit_log_timestamps():
+def test_audit_log_timestamps(client):
     """Test that all audit log entries have timestamps"""
     user_id = f"test_user_{uuid.uuid4()}"
     
@@ -63,7 +195,7 @@ def test_audit_log_timestamps():
         assert log["timestamp"] > 0
 
 
-def test_audit_log_filtering_by_user():
+def test_audit_log_filtering_by_user(client):
     """Test that audit logs can be filtered by user_id"""
     user1_id = f"test_user_{uuid.uuid4()}"
     user2_id = f"test_user_{uuid.uuid4()}"
@@ -83,7 +215,7 @@ def test_audit_log_filtering_by_user():
         assert log["user_id"] == user1_id
 
 
-def test_audit_log_filtering_by_time():
+def test_audit_log_filtering_by_time(client):
     """Test that audit logs can be filtered by time range"""
     user_id = f"test_user_{uuid.uuid4()}"
     
@@ -113,7 +245,61 @@ def test_audit_log_filtering_by_time():
         assert log["timestamp"] <= end_time
 
 
-def test_audit_log_details_structure():
+def test_audit_log_time_range_with_out_of_order_inserts():
+    """Test that per-user time filtering handles logs saved out of timestamp order"""
+    user_id = f"test_user_{uuid.uuid4()}"
+    session_id = f"session_{uuid.uuid4()}"
+    
+    # Save logs with timestamps 30, 10, 20 seconds into a fixed window
+    base_time = time.time() - 1000
+    for offset in (30, 10, 20):
+        database_service.save_audit_log(
+            log_id=str(uuid.uuid4()),
+            session_id=session_id,
+            user_id=user_id,
+            event_type="challenge_completion",
+            timestamp=base_time + offset,
+            details={"offset": offset}
+        )
+    
+    # Retrieve logs within [base + 10, base + 20]
+    logs = database_service.get_audit_logs(
+        user_id=user_id,
+        start_time=base_time + 10,
+        end_time=base_time + 20
+    )
+    
+    # Both boundary logs are included and returned in timestamp order
+    assert [log["details"]["offset"] for log in logs] == [10, 20]
+
+
+def test_audit_log_limit_keeps_latest_with_out_of_order_inserts():
+    """Test that limit keeps the latest logs with and without a user_id filter"""
+    user_id = f"test_user_{uuid.uuid4()}"
+    session_id = f"session_{uuid.uuid4()}"
+    
+    # Save logs out of timestamp order in a window no other test writes to
+    base_time = time.time() - 1_000_000
+    for offset in (30, 10, 40, 20):
+        database_service.save_audit_log(
+            log_id=str(uuid.uuid4()),
+            session_id=session_id,
+            user_id=user_id,
+            event_type="challenge_completion",
+            timestamp=base_time + offset,
+            details={"offset": offset}
+        )
+    
+    window = {"start_time": base_time, "end_time": base_time + 50}
+    by_user = database_service.get_audit_logs(user_id=user_id, limit=2, **window)
+    unfiltered = database_service.get_audit_logs(limit=2, **window)
+    
+    # Both paths return the two latest logs in timestamp order
+    assert [log["details"]["offset"] for log in by_user] == [30, 40]
+    assert [log["details"]["offset"] for log in unfiltered] == [30, 40]
+
+
+def test_audit_log_details_structure(client):
     """Test that audit log details are properly structured"""
     user_id = f"test_user_{uuid.uuid4()}"
     
@@ -131,8 +317,21 @@ def test_audit_log_details_structure():
 
 
 # Property-Based Tests
-from hypothesis import given, strategies as st, settings
-import pytest
+
+@st.composite
+def passing_scores(draw):
+    """
+    Draw (liveness, deepfake, emotion) triples that clear the scoring threshold.
+
+    Each lower bound is the smallest value that still lets the remaining
+    scores (at 1.0) reach ScoringEngine.THRESHOLD, so draws are not wasted.
+    """
+    w_l, w_d, w_e = ScoringEngine.LIVENESS_WEIGHT, ScoringEngine.DEEPFAKE_WEIGHT, ScoringEngine.EMOTION_WEIGHT
+    threshold = ScoringEngine.THRESHOLD
+    liveness = draw(st.floats(min_value=max(0.0, (threshold - w_d - w_e) / w_l), max_value=1.0))
+    deepfake = draw(st.floats(min_value=max(0.0, (threshold - w_l * liveness - w_e) / w_d), max_value=1.0))
+    emotion = draw(st.floats(min_value=min(1.0, max(0.0, (threshold - w_l * liveness - w_d * deepfake) / w_e)), max_value=1.0))
+    return liveness, deepfake, emotion
 
 
 @given(
@@ -146,9 +345,11 @@ import pytest
     ),
     num_challenges=st.integers(min_value=3, max_value=5)
 )
+@example(user_id="alice", num_challenges=3)
+@example(user_id="ユーザー", num_challenges=5)
 @settings(max_examples=100, deadline=None)
 @pytest.mark.property_test
-def test_property_audit_log_completeness(user_id, num_challenges):
+def test_property_audit_log_completeness(client, user_id, num_challenges):
     """
     **Validates: Requirements 7.5**
 
@@ -168,13 +369,7 @@ def test_property_audit_log_completeness(user_id, num_challenges):
     test_user_id = f"prop_test_{uuid.uuid4()}_{user_id[:20]}"
 
     # Create a session
-    response = client.post(
-        "/api/auth/verify",
-        json={"user_id": test_user_id}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    session_id = data["session_id"]
+    session_id = _new_session(client, test_user_id)
 
     # Retrieve all audit logs for this user
     audit_logs = database_service.get_audit_logs(user_id=test_user_id)
@@ -208,28 +403,8 @@ def test_property_audit_log_completeness(user_id, num_challenges):
 
     # Property 2: All audit logs must have complete structure
     for log in audit_logs:
-        # Required fields
-        assert "log_id" in log, "log_id is required"
-        assert "session_id" in log, "session_id is required"
-        assert "user_id" in log, "user_id is required"
-        assert "event_type" in log, "event_type is required"
-        assert "timestamp" in log, "timestamp is required"
-        assert "details" in log, "details is required"
-
-        # Field types
-        assert isinstance(log["log_id"], str), "log_id must be string"
-        assert isinstance(log["session_id"], str), "session_id must be string"
-        assert isinstance(log["user_id"], str), "user_id must be string"
-        assert isinstance(log["event_type"], str), "event_type must be string"
-        assert isinstance(log["timestamp"], (int, float)), "timestamp must be numeric"
-        assert isinstance(log["details"], dict), "details must be dict"
-
-        # Field values
-        assert len(log["log_id"]) > 0, "log_id must not be empty"
-        assert len(log["session_id"]) > 0, "session_id must not be empty"
-        assert len(log["user_id"]) > 0, "user_id must not be empty"
-        assert len(log["event_type"]) > 0, "event_type must not be empty"
-        assert log["timestamp"] > 0, "timestamp must be positive"
+        # Required fields, field types and non-empty/positive values
+        AuditLogRecord.model_validate(log)
 
         # Session and user consistency
         assert log["session_id"] == session_id, "All logs must belong to same session"
@@ -241,9 +416,14 @@ def test_property_audit_log_completeness(user_id, num_challenges):
     deepfake_score=st.floats(min_value=0.0, max_value=1.0),
     emotion_score=st.floats(min_value=0.0, max_value=1.0)
 )
-@settings(max_examples=100, deadline=None)
+# Threshold boundary: exactly 0.65 passes, 0.6499999999999999 fails
+@example(liveness_score=1.0, deepfake_score=1.0, emotion_score=0.0)
+@example(liveness_score=0.65, deepfake_score=0.65, emotion_score=0.65)
+@example(liveness_score=0.0, deepfake_score=0.0, emotion_score=0.0)
+@example(liveness_score=1.0, deepfake_score=1.0, emotion_score=1.0)
+@settings(max_examples=30, deadline=None)
 @pytest.mark.property_test
-def test_property_verification_result_persistence(liveness_score, deepfake_score, emotion_score):
+def test_property_verification_result_persistence(shared_session, scoring_engine, liveness_score, deepfake_score, emotion_score):
     """
     **Validates: Requirements 13.2**
     
@@ -259,28 +439,18 @@ def test_property_verification_result_persistence(liveness_score, deepfake_score
     3. Saved scores match the computed scores
     4. The verification decision (passed) is correctly stored
     """
-    from app.services.scoring_engine import ScoringEngine
-    from app.models.data_models import ScoringResult
-    
-    # Create a unique session for this test
-    test_user_id = f"prop_test_{uuid.uuid4()}"
     
-    # Create a session
-    response = client.post(
-        "/api/auth/verify",
-        json={"user_id": test_user_id}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    session_id = data["session_id"]
+    # Scores are the only input that varies, so reuse one session across examples
+    test_user_id, session_id = shared_session
     
     # Compute scoring result using the scoring engine
-    scoring_engine = ScoringEngine()
     scoring_result = scoring_engine.compute_final_score(
         liveness_score=liveness_score,
         deepfake_score=deepfake_score,
         emotion_score=emotion_score
     )
+    # Steer generation towards the pass/fail boundary, where the decision can go wrong
+    target(-abs(scoring_result.final_score - scoring_engine.THRESHOLD), label="distance to threshold")
     
     # Save verification result to database
     result_id = str(uuid.uuid4())
@@ -297,12 +467,8 @@ def test_property_verification_result_persistence(liveness_score, deepfake_score
     assert saved_result is not None, "Verification result must be saved to database"
     
     # Property 2: All required fields must be present
-    required_fields = [
-        "result_id", "session_id", "liveness_score", "deepfake_score",
-        "emotion_score", "final_score", "passed", "timestamp"
-    ]
-    for field in required_fields:
-        assert field in saved_result, f"Field '{field}' must be present in saved result"
+    missing = REQUIRED_RESULT_FIELDS - saved_result.keys()
+    assert not missing, f"Fields {sorted(missing)} must be present in saved result"
     
     # Property 3: result_id must match
     assert saved_result["result_id"] == result_id, "result_id must match"
@@ -350,14 +516,12 @@ def test_property_verification_result_persistence(liveness_score, deepfake_score
         f"Verification decision must be consistent with threshold ({scoring_engine.THRESHOLD})"
 
 
-@given(
-    liveness_score=st.floats(min_value=0.0, max_value=1.0),
-    deepfake_score=st.floats(min_value=0.0, max_value=1.0),
-    emotion_score=st.floats(min_value=0.0, max_value=1.0)
-)
-@settings(max_examples=100, deadline=None)
+@given(scores=passing_scores())
+@example(scores=(1.0, 1.0, 0.0))
+@example(scores=(1.0, 1.0, 1.0))
+@settings(max_examples=30, deadline=None)
 @pytest.mark.property_test
-def test_property_token_issuance_logging(liveness_score, deepfake_score, emotion_score):
+def test_property_token_issuance_logging(shared_session, scoring_engine, token_issuer, scores):
     """
     **Validates: Requirements 13.3**
     
@@ -373,395 +537,131 @@ def test_property_token_issuance_logging(liveness_score, deepfake_score, emotion
     4. Audit log details contain complete metadata
     5. Token expiration is set correctly (15 minutes from issuance)
     """
-    from app.services.scoring_engine import ScoringEngine
-    from app.services.token_issuer import TokenIssuer
-    
-    # Create a unique session for this test
-    test_user_id = f"prop_test_{uuid.uuid4()}"
     
-    # Create a session
-    response = client.post(
-        "/api/auth/verify",
-        json={"user_id": test_user_id}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    session_id = data["session_id"]
+    # Scores are the only input that varies, so reuse one session across examples
+    test_user_id, session_id = shared_session
+    liveness_score, deepfake_score, emotion_score = scores
     
     # Compute scoring result using the scoring engine
-    scoring_engine = ScoringEngine()
     scoring_result = scoring_engine.compute_final_score(
         liveness_score=liveness_score,
         deepfake_score=deepfake_score,
         emotion_score=emotion_score
     )
+    # Bias generation towards scores close to the issuance threshold
+    target(-abs(scoring_result.final_score - scoring_engine.THRESHOLD), label="distance to threshold")
     
-    # Only test token issuance if verification passes
-    if scoring_result.passed:
-        # Simulate token issuance (as done in main.py)
-        token_issuer = TokenIssuer()
-        token = token_issuer.issue_jwt_token(
-            user_id=test_user_id,
-            session_id=session_id,
-            final_score=scoring_result.final_score
-        )
-        
-        # Log token issuance (as done in main.py)
-        token_id = str(uuid.uuid4())
-        issued_at = time.time()
-        expires_at = issued_at + (token_issuer.TOKEN_EXPIRY_MINUTES * 60)
-        
-        database_service.save_token_issuance(
-            token_id=token_id,
-            user_id=test_user_id,
-            session_id=session_id,
-            issued_at=issued_at,
-            expires_at=expires_at
-        )
-        
-        # Log token issuance event in audit logs
-        log_id = str(uuid.uuid4())
-        database_service.save_audit_log(
-            log_id=log_id,
-            session_id=session_id,
-            user_id=test_user_id,
-            event_type="token_issuance",
-            timestamp=issued_at,
-            details={
-                "token_id": token_id,
-                "user_id": test_user_id,
-                "session_id": session_id,
-                "issued_at": issued_at,
-                "expires_at": expires_at,
-                "expiry_minutes": token_issuer.TOKEN_EXPIRY_MINUTES,
-                "final_score": scoring_result.final_score
-            }
-        )
-        
-        # Property 1: Token issuance must be logged in tokens table
-        # Query the tokens table directly
-        import sqlite3
-        conn = sqlite3.connect(database_service.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT token_id, user_id, session_id, issued_at, expires_at FROM tokens WHERE token_id = ?",
-            (token_id,)
-        )
-        token_record = cursor.fetchone()
-        conn.close()
-        
-        assert token_record is not None, "Token issuance must be logged in tokens table"
-        
-        # Property 2: All required fields must be present in tokens table
-        assert token_record[0] == token_id, "token_id must match"
-        assert token_record[1] == test_user_id, "user_id must match"
-        assert token_record[2] == session_id, "session_id must match"
-        assert token_record[3] == issued_at, "issued_at must match"
-        assert token_record[4] == expires_at, "expires_at must match"
-        
-        # Property 3: Token issuance must be logged in audit_logs table
-        audit_logs = database_service.get_audit_logs(user_id=test_user_id)
-        token_issuance_logs = [log for log in audit_logs if log["event_type"] == "token_issuance"]
-        
-        assert len(token_issuance_logs) > 0, "token_issuance event must be logged in audit_logs"
-        
-        # Find the specific log entry for this token
-        matching_log = None
-        for log in token_issuance_logs:
-            if log["details"].get("token_id") == token_id:
-                matching_log = log
-                break
-        
-        assert matching_log is not None, "Audit log for this specific token must exist"
-        
-        # Property 4: Audit log must have required fields
-        assert "log_id" in matching_log, "log_id must be present"
-        assert "session_id" in matching_log, "session_id must be present"
-        assert matching_log["session_id"] == session_id, "session_id must match"
-        assert "user_id" in matching_log, "user_id must be present"
-        assert matching_log["user_id"] == test_user_id, "user_id must match"
-        assert "event_type" in matching_log, "event_type must be present"
-        assert matching_log["event_type"] == "token_issuance", "event_type must be token_issuance"
-        assert "timestamp" in matching_log, "timestamp must be present"
-        assert "details" in matching_log, "details must be present"
-        
-        # Property 5: Audit log details must contain complete metadata
-        details = matching_log["details"]
-        assert "token_id" in details, "details must contain token_id"
-        assert details["token_id"] == token_id, "token_id in details must match"
-        assert "user_id" in details, "details must contain user_id"
-        assert details["user_id"] == test_user_id, "user_id in details must match"
-        assert "session_id" in details, "details must contain session_id"
-        assert details["session_id"] == session_id, "session_id in details must match"
-        assert "issued_at" in details, "details must contain issued_at"
-        assert details["issued_at"] == issued_at, "issued_at in details must match"
-        assert "expires_at" in details, "details must contain expires_at"
-        assert details["expires_at"] == expires_at, "expires_at in details must match"
-        assert "expiry_minutes" in details, "details must contain expiry_minutes"
-        assert "final_score" in details, "details must contain final_score"
-        
-        # Property 6: Token expiration must be set correctly (15 minutes from issuance)
-        expected_expiry_seconds = token_issuer.TOKEN_EXPIRY_MINUTES * 60
-        actual_expiry_seconds = expires_at - issued_at
-        assert abs(actual_expiry_seconds - expected_expiry_seconds) < 1.0, \
-            f"Token expiration must be {token_issuer.TOKEN_EXPIRY_MINUTES} minutes from issuance"
-        
-        # Property 7: Timestamps must be valid
-        assert isinstance(issued_at, (int, float)), "issued_at must be numeric"
-        assert isinstance(expires_at, (int, float)), "expires_at must be numeric"
-        assert issued_at > 0, "issued_at must be positive"
-        assert expires_at > issued_at, "expires_at must be after issued_at"
-        
-        # Property 8: Token must be a valid JWT string
-        assert isinstance(token, str), "Token must be a string"
-        assert len(token) > 0, "Token must not be empty"
-        assert token.count('.') == 2, "JWT must have 3 parts separated by dots"
-
-
-@given(
-    liveness_score=st.floats(min_value=0.0, max_value=1.0),
-    deepfake_score=st.floats(min_value=0.0, max_value=1.0),
-    emotion_score=st.floats(min_value=0.0, max_value=1.0),
-    num_challenges=st.integers(min_value=3, max_value=5)
-)
-@settings(max_examples=100, deadline=None)
-@pytest.mark.property_test
-def test_property_event_timestamp_recording(liveness_score, deepfake_score, emotion_score, num_challenges):
-    """
-    **Validates: Requirements 13.4**
-
-    Property 20: Event Timestamp Recording
-
-    For any significant system event (session start, challenge completion, verification result,
-    token issuance), the audit log should contain a timestamp.
-
-    This property verifies that:
-    1. All audit log entries have timestamps
-    2. Timestamps are valid (positive, reasonable values)
-    3. Events are ordered chronologically (session_start < challenge_completion < verification_result < token_issuance)
-    4. All event types (session_start, challenge_completion, verification_result, token_issuance) have timestamps
-    """
-    from app.services.scoring_engine import ScoringEngine
-    from app.services.token_issuer import TokenIssuer
-    from app.services.challenge_engine import ChallengeEngine
-    from app.models.data_models import ChallengeResult
-
-    # Create a unique session for this test
-    test_user_id = f"prop_test_{uuid.uuid4()}"
-
-    # Create a session (logs session_start event)
-    response = client.post(
-        "/api/auth/verify",
-        json={"user_id": test_user_id}
+    # passing_scores() can land a rounding error below the threshold
+    assume(scoring_result.passed)
+    
+    # Simulate token issuance (as done in main.py)
+    token = token_issuer.issue_jwt_token(
+        user_id=test_user_id,
+        session_id=session_id,
+        final_score=scoring_result.final_score
     )
-    assert response.status_code == 200
-    data = response.json()
-    session_id = data["session_id"]
-
-    # Simulate challenge completions (logs challenge_completion events)
-    challenge_engine = ChallengeEngine(database_service)
-    challenges = challenge_engine.generate_challenge_sequence(session_id, num_challenges)
-
-    for i, challenge in enumerate(challenges.challenges):
-        challenge_result = ChallengeResult(
-            challenge_id=challenge.challenge_id,
-            completed=True,
-            confidence=0.9,
-            timestamp=time.time()
-        )
-
-        # Log challenge completion
-        log_id = str(uuid.uuid4())
-        database_service.save_audit_log(
-            log_id=log_id,
-            session_id=session_id,
-            user_id=test_user_id,
-            event_type="challenge_completion",
-            timestamp=challenge_result.timestamp,
-            details={
-                "challenge_id": challenge.challenge_id,
-                "challenge_type": challenge.type.value,
-                "completed": challenge_result.completed,
-                "confidence": challenge_result.confidence
-            }
-        )
-
-        # Small delay to ensure timestamps are different
-        time.sleep(0.01)
-
-    # Compute scoring result (logs verification_result event)
-    scoring_engine = ScoringEngine()
-    scoring_result = scoring_engine.compute_final_score(
-        liveness_score=liveness_score,
-        deepfake_score=deepfake_score,
-        emotion_score=emotion_score
+    
+    # Log token issuance (as done in main.py)
+    token_id = str(uuid.uuid4())
+    issued_at = time.time()
+    expires_at = issued_at + (token_issuer.TOKEN_EXPIRY_MINUTES * 60)
+    
+    database_service.save_token_issuance(
+        token_id=token_id,
+        user_id=test_user_id,
+        session_id=session_id,
+        issued_at=issued_at,
+        expires_at=expires_at
     )
-
-    # Log verification result
+    
+    # Log token issuance event in audit logs
     log_id = str(uuid.uuid4())
     database_service.save_audit_log(
         log_id=log_id,
         session_id=session_id,
         user_id=test_user_id,
-        event_type="verification_result",
-        timestamp=scoring_result.timestamp,
+        event_type="token_issuance",
+        timestamp=issued_at,
         details={
-            "liveness_score": scoring_result.liveness_score,
-            "deepfake_score": scoring_result.deepfake_score,
-            "emotion_score": scoring_result.emotion_score,
-            "final_score": scoring_result.final_score,
-            "passed": scoring_result.passed
+            "token_id": token_id,
+            "user_id": test_user_id,
+            "session_id": session_id,
+            "issued_at": issued_at,
+            "expires_at": expires_at,
+            "expiry_minutes": token_issuer.TOKEN_EXPIRY_MINUTES,
+            "final_score": scoring_result.final_score
         }
     )
-
-    # If verification passes, issue token (logs token_issuance event)
-    if scoring_result.passed:
-        token_issuer = TokenIssuer()
-        token = token_issuer.issue_jwt_token(
-            user_id=test_user_id,
-            session_id=session_id,
-            final_score=scoring_result.final_score
-        )
-
-        token_id = str(uuid.uuid4())
-        issued_at = time.time()
-        expires_at = issued_at + (token_issuer.TOKEN_EXPIRY_MINUTES * 60)
-
-        database_service.save_token_issuance(
-            token_id=token_id,
-            user_id=test_user_id,
-            session_id=session_id,
-            issued_at=issued_at,
-            expires_at=expires_at
-        )
-
-        # Log token issuance
-        log_id = str(uuid.uuid4())
-        database_service.save_audit_log(
-            log_id=log_id,
-            session_id=session_id,
-            user_id=test_user_id,
-            event_type="token_issuance",
-            timestamp=issued_at,
-            details={
-                "token_id": token_id,
-                "user_id": test_user_id,
-                "session_id": session_id,
-                "issued_at": issued_at,
-                "expires_at": expires_at,
-                "expiry_minutes": token_issuer.TOKEN_EXPIRY_MINUTES,
-                "final_score": scoring_result.final_score
-            }
-        )
-
-    # Retrieve all audit logs for this session
+    
+    # Property 1: Token issuance must be logged in tokens table
+    token_record = database_service.get_token(token_id)
+    
+    assert token_record is not None, "Token issuance must be logged in tokens table"
+    
+    # Property 2: All required fields must be present in tokens table
+    assert token_record["token_id"] == token_id, "token_id must match"
+    assert token_record["user_id"] == test_user_id, "user_id must match"
+    assert token_record["session_id"] == session_id, "session_id must match"
+    assert token_record["issued_at"] == issued_at, "issued_at must match"
+    assert token_record["expires_at"] == expires_at, "expires_at must match"
+    
+    # Property 3: Token issuance must be logged in audit_logs table
     audit_logs = database_service.get_audit_logs(user_id=test_user_id)
-
-    # Property 1: All audit log entries must have timestamps
-    for log in audit_logs:
-        assert "timestamp" in log, f"Event {log['event_type']} must have a timestamp"
-        assert log["timestamp"] is not None, f"Event {log['event_type']} timestamp must not be None"
-
-    # Property 2: Timestamps must be valid (positive, reasonable values)
-    current_time = time.time()
-    for log in audit_logs:
-        assert isinstance(log["timestamp"], (int, float)), \
-            f"Event {log['event_type']} timestamp must be numeric"
-        assert log["timestamp"] > 0, \
-            f"Event {log['event_type']} timestamp must be positive"
-        assert log["timestamp"] <= current_time, \
-            f"Event {log['event_type']} timestamp must not be in the future"
-        # Timestamps should be within the last minute (reasonable for test execution)
-        assert log["timestamp"] >= current_time - 60, \
-            f"Event {log['event_type']} timestamp must be recent (within last minute)"
-
-    # Property 3: Events must be ordered chronologically
-    # Group events by type
-    session_start_logs = [log for log in audit_logs if log["event_type"] == "session_start"]
-    challenge_completion_logs = [log for log in audit_logs if log["event_type"] == "challenge_completion"]
-    verification_result_logs = [log for log in audit_logs if log["event_type"] == "verification_result"]
     token_issuance_logs = [log for log in audit_logs if log["event_type"] == "token_issuance"]
-
-    # Verify session_start exists and has timestamp
-    assert len(session_start_logs) > 0, "session_start event must exist"
-    session_start_time = session_start_logs[0]["timestamp"]
-
-    # Verify challenge_completion events exist and have timestamps
-    assert len(challenge_completion_logs) >= num_challenges, \
-        f"Expected at least {num_challenges} challenge_completion events"
-
-    # All challenge completions should be after session start
-    for log in challenge_completion_logs:
-        assert log["timestamp"] >= session_start_time, \
-            "challenge_completion timestamp must be >= session_start timestamp"
-
-    # Challenge completions should be ordered chronologically
-    challenge_timestamps = [log["timestamp"] for log in challenge_completion_logs]
-    for i in range(len(challenge_timestamps) - 1):
-        assert challenge_timestamps[i] <= challenge_timestamps[i + 1], \
-            "challenge_completion events must be ordered chronologically"
-
-    # Verify verification_result exists and has timestamp
-    assert len(verification_result_logs) > 0, "verification_result event must exist"
-    verification_result_time = verification_result_logs[0]["timestamp"]
-
-    # verification_result should be after all challenge completions
-    if len(challenge_completion_logs) > 0:
-        last_challenge_time = max(log["timestamp"] for log in challenge_completion_logs)
-        assert verification_result_time >= last_challenge_time, \
-            "verification_result timestamp must be >= last challenge_completion timestamp"
-
-    # If token was issued, verify token_issuance has timestamp and is ordered correctly
-    if scoring_result.passed:
-        assert len(token_issuance_logs) > 0, "token_issuance event must exist when verification passes"
-        token_issuance_time = token_issuance_logs[0]["timestamp"]
-
-        # token_issuance should be after verification_result
-        assert token_issuance_time >= verification_result_time, \
-            "token_issuance timestamp must be >= verification_result timestamp"
-
-    # Property 4: All event types must have timestamps in their details (where applicable)
-    for log in session_start_logs:
-        assert "start_time" in log["details"], \
-            "session_start details must contain start_time"
-        assert isinstance(log["details"]["start_time"], (int, float)), \
-            "start_time must be numeric"
-
-    for log in challenge_completion_logs:
-        # Challenge completion details should have the challenge metadata
-        assert "challenge_id" in log["details"], \
-            "challenge_completion details must contain challenge_id"
-        assert "completed" in log["details"], \
-            "challenge_completion details must contain completed status"
-
-    for log in verification_result_logs:
-        # Verification result details should have all scores
-        assert "liveness_score" in log["details"], \
-            "verification_result details must contain liveness_score"
-        assert "deepfake_score" in log["details"], \
-            "verification_result details must contain deepfake_score"
-        assert "emotion_score" in log["details"], \
-            "verification_result details must contain emotion_score"
-        assert "final_score" in log["details"], \
-            "verification_result details must contain final_score"
-        assert "passed" in log["details"], \
-            "verification_result details must contain passed status"
-
+    
+    assert len(token_issuance_logs) > 0, "token_issuance event must be logged in audit_logs"
+    
+    # Find the specific log entry for this token
+    matching_log = None
     for log in token_issuance_logs:
-        # Token issuance details should have token metadata
-        assert "token_id" in log["details"], \
-            "token_issuance details must contain token_id"
-        assert "issued_at" in log["details"], \
-            "token_issuance details must contain issued_at"
-        assert "expires_at" in log["details"], \
-            "token_issuance details must contain expires_at"
-        assert isinstance(log["details"]["issued_at"], (int, float)), \
-            "issued_at must be numeric"
-        assert isinstance(log["details"]["expires_at"], (int, float)), \
-            "expires_at must be numeric"
-        assert log["details"]["expires_at"] > log["details"]["issued_at"], \
-            "expires_at must be after issued_at"
-
+        if log["details"].get("token_id") == token_id:
+            matching_log = log
+            break
+    
+    assert matching_log is not None, "Audit log for this specific token must exist"
+    
+    # Property 4: Audit log must have required fields
+    assert "log_id" in matching_log, "log_id must be present"
+    assert "session_id" in matching_log, "session_id must be present"
+    assert matching_log["session_id"] == session_id, "session_id must match"
+    assert "user_id" in matching_log, "user_id must be present"
+    assert matching_log["user_id"] == test_user_id, "user_id must match"
+    assert "event_type" in matching_log, "event_type must be present"
+    assert matching_log["event_type"] == "token_issuance", "event_type must be token_issuance"
+    assert "timestamp" in matching_log, "timestamp must be present"
+    assert "details" in matching_log, "details must be present"
+    
+    # Property 5: Audit log details must contain complete metadata
+    details = matching_log["details"]
+    assert "token_id" in details, "details must contain token_id"
+    assert details["token_id"] == token_id, "token_id in details must match"
+    assert "user_id" in details, "details must contain user_id"
+    assert details["user_id"] == test_user_id, "user_id in details must match"
+    assert "session_id" in details, "details must contain session_id"
+    assert details["session_id"] == session_id, "session_id in details must match"
+    assert "issued_at" in details, "details must contain issued_at"
+    assert details["issued_at"] == issued_at, "issued_at in details must match"
+    assert "expires_at" in details, "details must contain expires_at"
+    assert details["expires_at"] == expires_at, "expires_at in details must match"
+    assert "expiry_minutes" in details, "details must contain expiry_minutes"
+    assert "final_score" in details, "details must contain final_score"
+    
+    # Property 6: Token expiration must be set correctly (15 minutes from issuance)
+    expected_expiry_seconds = token_issuer.TOKEN_EXPIRY_MINUTES * 60
+    actual_expiry_seconds = expires_at - issued_at
+    assert abs(actual_expiry_seconds - expected_expiry_seconds) < 1.0, \
+        f"Token expiration must be {token_issuer.TOKEN_EXPIRY_MINUTES} minutes from issuance"
+    
+    # Property 7: Timestamps must be valid
+    assert isinstance(issued_at, (int, float)), "issued_at must be numeric"
+    assert isinstance(expires_at, (int, float)), "expires_at must be numeric"
+    assert issued_at > 0, "issued_at must be positive"
+    assert expires_at > issued_at, "expires_at must be after issued_at"
+    
+    # Property 8: Token must be a valid JWT string
+    assert isinstance(token, str), "Token must be a string"
+    assert len(token) > 0, "Token must not be empty"
+    assert token.count('.') == 2, "JWT must have 3 parts separated by dots"
 
 
 @given(
@@ -770,9 +670,11 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
     emotion_score=st.floats(min_value=0.0, max_value=1.0),
     num_challenges=st.integers(min_value=3, max_value=5)
 )
+@example(liveness_score=1.0, deepfake_score=1.0, emotion_score=1.0, num_challenges=3)
+@example(liveness_score=0.0, deepfake_score=0.0, emotion_score=0.0, num_challenges=5)
 @settings(max_examples=100, deadline=None)
 @pytest.mark.property_test
-def test_property_event_timestamp_recording(liveness_score, deepfake_score, emotion_score, num_challenges):
+def test_property_event_timestamp_recording(timestamp_session, scoring_engine, token_issuer, challenge_engine, liveness_score, deepfake_score, emotion_score, num_challenges):
     """
     **Validates: Requirements 13.4**
     
@@ -787,27 +689,20 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
     3. Events are ordered chronologically (session_start < challenge_completion < verification_result < token_issuance)
     4. All event types (session_start, challenge_completion, verification_result, token_issuance) have timestamps
     """
-    from app.services.scoring_engine import ScoringEngine
-    from app.services.token_issuer import TokenIssuer
-    from app.services.challenge_engine import ChallengeEngine
-    from app.models.data_models import ChallengeResult
     
-    # Create a unique session for this test
-    test_user_id = f"prop_test_{uuid.uuid4()}"
+    # The session (and its session_start event) is shared across examples;
+    # each example's own entries are picked out by their IDs below
+    test_user_id, session_id, session_start_logs = timestamp_session
+    example_start = time.time()
     
-    # Create a session (logs session_start event)
-    response = client.post(
-        "/api/auth/verify",
-        json={"user_id": test_user_id}
-    )
-    assert response.status_code == 200
-    data = response.json()
-    session_id = data["session_id"]
+    # One urandom read for the challenge, verification and token IDs
+    example_ids = _uuid_batch(num_challenges + 3)
+    ids = iter(example_ids)
     
     # Simulate challenge completions (logs challenge_completion events)
-    challenge_engine = ChallengeEngine()
     challenges = challenge_engine.generate_challenge_sequence(session_id, num_challenges)
     
+    challenge_logs = []
     for i, challenge in enumerate(challenges.challenges):
         challenge_result = ChallengeResult(
             challenge_id=challenge.challenge_id,
@@ -816,27 +711,24 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
             timestamp=time.time()
         )
         
-        # Log challenge completion
-        log_id = str(uuid.uuid4())
-        database_service.save_audit_log(
-            log_id=log_id,
-            session_id=session_id,
-            user_id=test_user_id,
-            event_type="challenge_completion",
-            timestamp=challenge_result.timestamp,
-            details={
+        challenge_logs.append({
+            "log_id": next(ids),
+            "session_id": session_id,
+            "user_id": test_user_id,
+            "event_type": "challenge_completion",
+            "timestamp": challenge_result.timestamp,
+            "details": {
                 "challenge_id": challenge.challenge_id,
                 "challenge_type": challenge.type.value,
                 "completed": challenge_result.completed,
                 "confidence": challenge_result.confidence
             }
-        )
-        
-        # Small delay to ensure timestamps are different
-        time.sleep(0.01)
+        })
+    
+    # Log all challenge completions in one batch
+    database_service.save_audit_logs_bulk(challenge_logs)
     
     # Compute scoring result (logs verification_result event)
-    scoring_engine = ScoringEngine()
     scoring_result = scoring_engine.compute_final_score(
         liveness_score=liveness_score,
         deepfake_score=deepfake_score,
@@ -844,7 +736,7 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
     )
     
     # Log verification result
-    log_id = str(uuid.uuid4())
+    log_id = next(ids)
     database_service.save_audit_log(
         log_id=log_id,
         session_id=session_id,
@@ -862,14 +754,13 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
     
     # If verification passes, issue token (logs token_issuance event)
     if scoring_result.passed:
-        token_issuer = TokenIssuer()
         token = token_issuer.issue_jwt_token(
             user_id=test_user_id,
             session_id=session_id,
             final_score=scoring_result.final_score
         )
         
-        token_id = str(uuid.uuid4())
+        token_id = next(ids)
         issued_at = time.time()
         expires_at = issued_at + (token_issuer.TOKEN_EXPIRY_MINUTES * 60)
         
@@ -882,7 +773,7 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
         )
         
         # Log token issuance
-        log_id = str(uuid.uuid4())
+        log_id = next(ids)
         database_service.save_audit_log(
             log_id=log_id,
             session_id=session_id,
@@ -900,8 +791,13 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
             }
         )
     
-    # Retrieve all audit logs for this session
-    audit_logs = database_service.get_audit_logs(user_id=test_user_id)
+    # Retrieve this example's audit logs plus the session's session_start event
+    example_log_ids = set(example_ids)
+    example_logs = [
+        log for log in database_service.get_audit_logs(user_id=test_user_id, start_time=example_start)
+        if log["log_id"] in example_log_ids
+    ]
+    audit_logs = session_start_logs + example_logs
     
     # Property 1: All audit log entries must have timestamps
     for log in audit_logs:
@@ -917,16 +813,21 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
             f"Event {log['event_type']} timestamp must be positive"
         assert log["timestamp"] <= current_time, \
             f"Event {log['event_type']} timestamp must not be in the future"
-        # Timestamps should be within the last minute (reasonable for test execution)
+    # Entries written by this example should be within the last minute; the
+    # module-scoped session_start can be older once the run gets long
+    for log in example_logs:
         assert log["timestamp"] >= current_time - 60, \
             f"Event {log['event_type']} timestamp must be recent (within last minute)"
     
     # Property 3: Events must be ordered chronologically
-    # Group events by type
-    session_start_logs = [log for log in audit_logs if log["event_type"] == "session_start"]
-    challenge_completion_logs = [log for log in audit_logs if log["event_type"] == "challenge_completion"]
-    verification_result_logs = [log for log in audit_logs if log["event_type"] == "verification_result"]
-    token_issuance_logs = [log for log in audit_logs if log["event_type"] == "token_issuance"]
+    # Group events by type in a single pass
+    logs_by_type = defaultdict(list)
+    for log in audit_logs:
+        logs_by_type[log["event_type"]].append(log)
+    session_start_logs = logs_by_type["session_start"]
+    challenge_completion_logs = logs_by_type["challenge_completion"]
+    verification_result_logs = logs_by_type["verification_result"]
+    token_issuance_logs = logs_by_type["token_issuance"]
     
     # Verify session_start exists and has timestamp
     assert len(session_start_logs) > 0, "session_start event must exist"
@@ -941,12 +842,14 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
         assert log["timestamp"] >= session_start_time, \
             "challenge_completion timestamp must be >= session_start timestamp"
     
-    # Challenge completions should be ordered chronologically
-    # Note: We just verify all timestamps exist and are after session start
-    # The actual chronological order is ensured by the time.sleep() in the test
-    challenge_timestamps = [log["timestamp"] for log in challenge_completion_logs]
-    # Verify timestamps are in a reasonable range (all within the test execution window)
-    assert len(challenge_timestamps) == num_challenges, \
+    # Challenge completions should be recorded chronologically, and come back
+    # in the order they were completed
+    saved_timestamps = [log["timestamp"] for log in challenge_logs]
+    assert saved_timestamps == sorted(saved_timestamps), \
+        "challenge_completion events must be recorded chronologically"
+    assert [log["log_id"] for log in challenge_completion_logs] == [log["log_id"] for log in challenge_logs], \
+        "challenge_completion events must be returned in completion order"
+    assert len(challenge_completion_logs) == num_challenges, \
         f"Expected exactly {num_challenges} challenge_completion events"
     
     # Verify verification_result exists and has timestamp
@@ -969,46 +872,10 @@ def test_property_event_timestamp_recording(liveness_score, deepfake_score, emot
             "token_issuance timestamp must be >= verification_result timestamp"
     
     # Property 4: All event types must have timestamps in their details (where applicable)
-    for log in session_start_logs:
-        assert "start_time" in log["details"], \
-            "session_start details must contain start_time"
-        assert isinstance(log["details"]["start_time"], (int, float)), \
-            "start_time must be numeric"
-    
-    for log in challenge_completion_logs:
-        # Challenge completion details should have the challenge metadata
-        assert "challenge_id" in log["details"], \
-            "challenge_completion details must contain challenge_id"
-        assert "completed" in log["details"], \
-            "challenge_completion details must contain completed status"
-    
-    for log in verification_result_logs:
-        # Verification result details should have all scores
-        assert "liveness_score" in log["details"], \
-            "verification_result details must contain liveness_score"
-        assert "deepfake_score" in log["details"], \
-            "verification_result details must contain deepfake_score"
-        assert "emotion_score" in log["details"], \
-            "verification_result details must contain emotion_score"
-        assert "final_score" in log["details"], \
-            "verification_result details must contain final_score"
-        assert "passed" in log["details"], \
-            "verification_result details must contain passed status"
-    
-    for log in token_issuance_logs:
-        # Token issuance details should have token metadata
-        assert "token_id" in log["details"], \
-            "token_issuance details must contain token_id"
-        assert "issued_at" in log["details"], \
-            "token_issuance details must contain issued_at"
-        assert "expires_at" in log["details"], \
-            "token_issuance details must contain expires_at"
-        assert isinstance(log["details"]["issued_at"], (int, float)), \
-            "issued_at must be numeric"
-        assert isinstance(log["details"]["expires_at"], (int, float)), \
-            "expires_at must be numeric"
-        assert log["details"]["expires_at"] > log["details"]["issued_at"], \
-            "expires_at must be after issued_at"
+    for log in audit_logs:
+        schema = EVENT_DETAIL_SCHEMAS.get(log["event_type"])
+        if schema is not None:
+            schema.model_validate(log["details"])
 
 
 def test_audit_log_retention_90_days():
@@ -1022,8 +889,6 @@ def test_audit_log_retention_90_days():
     2. Logs are not automatically deleted before 90 days
     3. Time-based filtering works correctly for old logs
     """
-    import sqlite3
-    
     user_id = f"test_user_{uuid.uuid4()}"
     session_id = f"session_{uuid.uuid4()}"
     
@@ -1037,37 +902,34 @@ def test_audit_log_retention_90_days():
     log_id_90_days = str(uuid.uuid4())
     log_id_current = str(uuid.uuid4())
     
-    # Directly insert logs with old timestamps into the database
-    # (bypassing the current time in save_audit_log)
-    conn = sqlite3.connect(database_service.db_path)
-    cursor = conn.cursor()
-    
-    # Insert log from 91 days ago
-    cursor.execute(
-        """INSERT INTO audit_logs (log_id, session_id, user_id, event_type, timestamp, details)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (log_id_91_days, session_id, user_id, "session_start", ninety_one_days_ago, 
-         '{"test": "91_days_old"}')
-    )
-    
-    # Insert log from exactly 90 days ago
-    cursor.execute(
-        """INSERT INTO audit_logs (log_id, session_id, user_id, event_type, timestamp, details)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (log_id_90_days, session_id, user_id, "verification_result", ninety_days_ago,
-         '{"test": "90_days_old"}')
-    )
-    
-    # Insert log from current time
-    cursor.execute(
-        """INSERT INTO audit_logs (log_id, session_id, user_id, event_type, timestamp, details)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (log_id_current, session_id, user_id, "token_issuance", current_time,
-         '{"test": "current"}')
-    )
-    
-    conn.commit()
-    conn.close()
+    # Insert logs with old timestamps directly into the in-memory store
+    # (the timestamp is stored as given), all in one batch
+    database_service.save_audit_logs_bulk([
+        {
+            "log_id": log_id_91_days,
+            "session_id": session_id,
+            "user_id": user_id,
+            "event_type": "session_start",
+            "timestamp": ninety_one_days_ago,
+            "details": '{"test": "91_days_old"}'
+        },
+        {
+            "log_id": log_id_90_days,
+            "session_id": session_id,
+            "user_id": user_id,
+            "event_type": "verification_result",
+            "timestamp": ninety_days_ago,
+            "details": '{"test": "90_days_old"}'
+        },
+        {
+            "log_id": log_id_current,
+            "session_id": session_id,
+            "user_id": user_id,
+            "event_type": "token_issuance",
+            "timestamp": current_time,
+            "details": '{"test": "current"}'
+        },
+    ])
     
     # Test 1: Verify all logs can be retrieved (no automatic deletion)
     all_logs = database_service.get_audit_logs(user_id=user_id, limit=1000)
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.blockchain_ledger import BlockchainLedger, Block
 from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 
 
 def run_tests():
@@ -44,8 +45,9 @@ def run_tests():
     passed += 1
 
     # ---- TEST 3: Signature verification ----
-    print("\n[TEST 3] RSA signature verification...")
+    print("\n[TEST 3] Signature verification...")
     assert ledger.verify_block_signature(genesis), "Genesis signature invalid"
+    assert ledger.signature_algorithm == "Ed25519"
     print("  PASS: Genesis block signature verified")
     passed += 1
 
@@ -185,6 +187,8 @@ def run_tests():
     assert len(ledger2.chain) == 4, f"Reload expected 4, got {len(ledger2.chain)}"
     reload_integrity = ledger2.verify_chain_integrity()
     assert reload_integrity["valid"], f"Reloaded chain invalid: {reload_integrity['errors']}"
+    assert len(ledger2.get_blocks_by_session("sess-001")) == 2
+    assert ledger2.get_block_by_id(b1.block_id)["index"] == 1
     print(f"  PASS: Reloaded {len(ledger2.chain)} blocks, integrity verified")
     passed += 1
 
@@ -192,36 +196,42 @@ def run_tests():
     print("\n[TEST 14] Thread safety (concurrent writes)...")
     errors_found = []
 
-    def add_block(idx):
+    def add_batch(idx):
         try:
-            ledger.add_verification_block(
-                session_id=f"concurrent-{idx}", user_id=f"user-{idx}",
-                verification_score=0.7 + idx * 0.01, liveness_score=0.8,
-                emotion_score=0.7, deepfake_score=0.6, passed=True
-            )
+            ledger.add_verification_blocks_bulk([
+                dict(
+                    session_id=f"concurrent-{idx}-{j}", user_id=f"user-{idx}",
+                    verification_score=0.7 + idx * 0.01, liveness_score=0.8,
+                    emotion_score=0.7, deepfake_score=0.6, passed=True
+                )
+                for j in range(2)
+            ])
         except Exception as e:
             errors_found.append(str(e))
 
-    threads = [threading.Thread(target=add_block, args=(i,)) for i in range(5)]
+    before = len(ledger.chain)
+    threads = [threading.Thread(target=add_batch, args=(i,)) for i in range(5)]
     for t in threads:
         t.start()
     for t in threads:
         t.join()
     assert len(errors_found) == 0, f"Thread errors: {errors_found}"
+    assert len(ledger.chain) == before + 10, f"Expected {before + 10} blocks, got {len(ledger.chain)}"
     indices = [b.index for b in ledger.chain]
     assert indices == list(range(len(ledger.chain))), f"Non-sequential: {indices}"
     final_check = ledger.verify_chain_integrity()
     assert final_check["valid"], f"Post-concurrent invalid: {final_check['errors']}"
-    print(f"  PASS: 5 concurrent writes, chain valid with {final_check['block_count']} blocks")
+    print(f"  PASS: 5 concurrent bulk writes, chain valid with {final_check['block_count']} blocks")
     passed += 1
 
     # ---- TEST 15: Block serialization round-trip ----
     print("\n[TEST 15] Block serialization round-trip...")
-    for b in ledger.chain:
-        d = b.to_dict()
-        restored = Block.from_dict(d)
+    payload = json.dumps([b.to_dict() for b in ledger.chain], default=str)
+    restored_chain = [Block.from_dict(d) for d in json.loads(payload)]
+    assert len(restored_chain) == len(ledger.chain)
+    for restored, b in zip(restored_chain, ledger.chain):
         assert restored.block_hash == b.block_hash
-        assert restored.compute_hash() == b.compute_hash()
+        assert restored.compute_hash() == b.block_hash
         assert restored.signature == b.signature
     print(f"  PASS: All {len(ledger.chain)} blocks serialize/deserialize correctly")
     passed += 1
@@ -230,9 +240,6 @@ def run_tests():
     print("\n[TEST 16] Independent proof verification (3rd party simulation)...")
     proof = ledger.generate_proof(1)
     # Simulate a third party with only the proof JSON
-    from cryptography.hazmat.primitives.asymmetric import padding as asym_padding
-    from cryptography.hazmat.primitives import hashes as crypto_hashes
-
     third_party_pubkey = serialization.load_pem_public_key(
         proof["public_key"].encode(), backend=None
     )
@@ -245,21 +252,14 @@ def run_tests():
     sig_bytes = bytes.fromhex(block_data["signature"])
     hash_bytes = block_data["block_hash"].encode()
     try:
-        third_party_pubkey.verify(
-            sig_bytes, hash_bytes,
-            asym_padding.PSS(
-                mgf=asym_padding.MGF1(crypto_hashes.SHA256()),
-                salt_length=asym_padding.PSS.MAX_LENGTH,
-            ),
-            crypto_hashes.SHA256(),
-        )
+        third_party_pubkey.verify(sig_bytes, hash_bytes)
         sig_valid = True
     except Exception:
         sig_valid = False
     assert sig_valid, "3rd party signature verification failed"
     # Verify chain linkage
     assert block_data["previous_hash"] == proof["previous_block_hash"]
-    print("  PASS: Third-party independently verified block hash + RSA signature + chain link")
+    print("  PASS: Third-party independently verified block hash + Ed25519 signature + chain link")
     passed += 1
 
     # ---- TEST 17: Edge cases ----
@@ -293,6 +293,55 @@ def run_tests():
     print(f"  PASS: Auto-persisted keys, chain survived restart with {len(auto_ledger2.chain)} blocks")
     passed += 1
 
+    # ---- TEST 19: Existing RSA keys keep signing with RSA-PSS ----
+    print("\n[TEST 19] RSA key compatibility...")
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    rsa_ledger = BlockchainLedger(
+        private_key=rsa_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ),
+        public_key=rsa_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ),
+        storage_dir=tempfile.mkdtemp()
+    )
+    rsa_ledger.add_verification_block(
+        session_id="rsa-001", user_id="user-rsa",
+        verification_score=0.8, liveness_score=0.8,
+        emotion_score=0.8, deepfake_score=0.8, passed=True
+    )
+    assert rsa_ledger.signature_algorithm == "RSA-PSS with SHA-256"
+    assert rsa_ledger.key_size == 2048
+    rsa_integrity = rsa_ledger.verify_chain_integrity()
+    assert rsa_integrity["valid"], f"RSA chain invalid: {rsa_integrity['errors']}"
+    print("  PASS: RSA-keyed ledger signs and verifies with RSA-PSS")
+    passed += 1
+
+    # ---- TEST 20: Bulk append rejects a bad batch without partial writes ----
+    print("\n[TEST 20] Bulk append with an invalid payload...")
+    tmp3 = tempfile.mkdtemp()
+    bulk_ledger = BlockchainLedger(storage_dir=tmp3)
+    good = dict(
+        session_id="bulk-001", user_id="user-bulk",
+        verification_score=0.8, liveness_score=0.8,
+        emotion_score=0.8, deepfake_score=0.8, passed=True
+    )
+    bad = {k: v for k, v in good.items() if k != "passed"}
+    try:
+        bulk_ledger.add_verification_blocks_bulk([good, bad])
+        raised = False
+    except TypeError:
+        raised = True
+    assert raised, "Missing kwarg should raise TypeError"
+    assert len(bulk_ledger.chain) == 1, f"Partial batch appended: {len(bulk_ledger.chain)} blocks"
+    assert bulk_ledger.get_blocks_by_session("bulk-001") == []
+    assert len(BlockchainLedger(storage_dir=tmp3).chain) == 1, "Ledger file disagrees with memory"
+    print("  PASS: Invalid batch left chain, indexes and ledger file untouched")
+    passed += 1
+
     print("\n" + "=" * 60)
     print(f"ALL {passed} TESTS PASSED (0 failed)")
     print("=" * 60)
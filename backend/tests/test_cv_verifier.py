@@ -1,6 +1,10 @@
 """
 Unit tests for CVVerifier class
 """
+import functools
+from collections import namedtuple
+from types import SimpleNamespace
+
 import pytest
 import numpy as np
 import cv2
@@ -8,6 +12,156 @@ from app.services.cv_verifier import CVVerifier
 from app.models.data_models import Challenge, ChallengeType, ChallengeResult
 
 
+# Challenges are only read by CVVerifier, so tests share these instances
+NOD_UP_CHALLENGE = Challenge(
+    challenge_id="test_session_gesture_0_nod_up",
+    type=ChallengeType.GESTURE,
+    instruction="Nod your head up",
+    timeout_seconds=10
+)
+SMILE_CHALLENGE = Challenge(
+    challenge_id="test_session_expression_0_smile",
+    type=ChallengeType.EXPRESSION,
+    instruction="Smile",
+    timeout_seconds=10
+)
+INVALID_ID_CHALLENGE = Challenge(
+    challenge_id="invalid",  # Invalid format
+    type=ChallengeType.GESTURE,
+    instruction="Nod your head up",
+    timeout_seconds=10
+)
+
+
+# Seeded generator for all test data, so random landmarks and frames are reproducible
+RNG = np.random.default_rng(0xC0FFEE)
+
+
+def _read_only(array):
+    """Freeze an array shared between tests so accidental writes raise"""
+    array.setflags(write=False)
+    return array
+
+
+# Realistic normalized positions of the key landmarks of a frontal face
+_KEY_LANDMARKS = {
+    # Eyes
+    33: (0.35, 0.4, 0.01),     # Left eye outer
+    133: (0.42, 0.4, 0.01),    # Left eye inner
+    159: (0.385, 0.38, 0.01),  # Left eye top
+    145: (0.385, 0.42, 0.01),  # Left eye bottom
+    263: (0.58, 0.4, 0.01),    # Right eye inner
+    362: (0.65, 0.4, 0.01),    # Right eye outer
+    386: (0.615, 0.38, 0.01),  # Right eye top
+    374: (0.615, 0.42, 0.01),  # Right eye bottom
+    # Nose
+    1: (0.5, 0.5, 0.03),       # Nose tip
+    # Mouth
+    61: (0.4, 0.65, 0.015),    # Left mouth
+    291: (0.6, 0.65, 0.015),   # Right mouth
+    # Chin and forehead
+    152: (0.5, 0.8, -0.005),   # Chin
+    10: (0.5, 0.2, 0.008),     # Forehead
+}
+_KEY_LANDMARK_INDICES = np.fromiter(_KEY_LANDMARKS, dtype=np.intp)
+_KEY_LANDMARK_POSITIONS = np.array(list(_KEY_LANDMARKS.values()))
+
+
+# Read-only all-zero landmark set for tests that only pass it through
+ZERO_LANDMARKS = _read_only(np.zeros((468, 3)))
+
+
+@pytest.fixture(scope="module")
+def blank_frame():
+    """Black 480x640 BGR frame shared by every test in the module (read-only)"""
+    return _read_only(np.zeros((480, 640, 3), dtype=np.uint8))
+
+
+@pytest.fixture(scope="module")
+def random_frame_720_1280():
+    """Random 720x1280 BGR frame, generated once per module (read-only)"""
+    return _read_only(RNG.integers(0, 255, (720, 1280, 3), dtype=np.uint8))
+
+
+@pytest.fixture(scope="module")
+def random_frame_1080_1920():
+    """Random 1080x1920 BGR frame, generated once per module (read-only)"""
+    return _read_only(RNG.integers(0, 255, (1080, 1920, 3), dtype=np.uint8))
+
+
+def _assert_unit_float(value):
+    """Assert value is a plain Python float (not a numpy scalar) in [0.0, 1.0]"""
+    assert type(value) is float and 0.0 <= value <= 1.0, f"{value!r} is not a float in [0.0, 1.0]"
+
+
+@functools.lru_cache(maxsize=1)
+def _create_realistic_landmarks():
+    """
+    Create realistic facial landmarks.
+    
+    Returns a read-only 468x3 array with realistic normalized coordinates
+    for a frontal face view. It is built once and shared by every test in
+    the module; copy it before making changes.
+    """
+    # Random but realistic values everywhere, then the key landmarks
+    landmarks = np.column_stack((
+        RNG.uniform(0.2, 0.8, 468),
+        RNG.uniform(0.2, 0.8, 468),
+        RNG.normal(0.0, 0.01, 468),
+    ))
+    landmarks[_KEY_LANDMARK_INDICES] = _KEY_LANDMARK_POSITIONS
+    
+    return _read_only(landmarks)
+
+
+def _landmark_sequence(landmarks, n):
+    """Return a writable (n, 468, 3) sequence with every frame set to landmarks"""
+    return np.broadcast_to(landmarks, (n, *landmarks.shape)).copy()
+
+
+def _frame_views(frame, n):
+    """
+    Return n distinct views of frame without copying pixel data.
+
+    CVVerifier caches detections by id(frame), so a sequence must hold
+    separate array objects for the mocked landmarker to see every frame.
+    """
+    return [frame.view() for _ in range(n)]
+
+
+# Stand-in for a MediaPipe NormalizedLandmark
+Landmark = namedtuple("Landmark", ["x", "y", "z"])
+
+# Fake detection result for a frame with no face in it
+NO_FACE = SimpleNamespace(face_landmarks=[], face_blendshapes=[])
+
+
+def _detection_result(landmarks):
+    """Build a fake FaceLandmarker result holding one face with the given (468, 3) landmarks"""
+    return SimpleNamespace(
+        face_landmarks=[list(map(Landmark._make, landmarks.tolist()))],
+        face_blendshapes=[],
+    )
+
+
+def _fake_landmarker(detect):
+    """Minimal FaceLandmarker stand-in (CVVerifier.__del__ calls close())"""
+    return SimpleNamespace(detect=detect, close=lambda: None)
+
+
+def _sequence_landmarker(landmark_sequence):
+    """Fake landmarker that cycles through landmark_sequence, one set per detect()"""
+    results = [_detection_result(landmarks) for landmarks in landmark_sequence]
+    calls = 0
+
+    def detect(mp_image):
+        nonlocal calls
+        result = results[calls % len(results)]
+        calls += 1
+        return result
+
+    return _fake_landmarker(detect)
+
 
 class TestCVVerifierInitialization:
     """Test CVVerifier initialization and configuration"""
@@ -42,37 +196,30 @@ class TestCVVerifierInitialization:
 class TestFramePreprocessing:
     """Test frame preprocessing functionality"""
     
-    def test_preprocess_frame_resizes_correctly(self):
+    @pytest.fixture(scope="class")
+    def verifier(self):
+        """CVVerifier shared by the class (preprocess_frame keeps no state)"""
+        return CVVerifier()
+    
+    def test_preprocess_frame_resizes_correctly(self, verifier, random_frame_720_1280):
         """Test that frames are resized to target dimensions"""
-        verifier = CVVerifier()
-        
-        # Create a test frame (BGR format, OpenCV default)
-        original_frame = np.random.randint(0, 255, (720, 1280, 3), dtype=np.uint8)
-        
-        # Preprocess with default target size (640, 480)
-        processed = verifier.preprocess_frame(original_frame)
+        # Preprocess a 720p BGR frame with default target size (640, 480)
+        processed = verifier.preprocess_frame(random_frame_720_1280)
         
         # Verify dimensions
         assert processed.shape == (480, 640, 3)
     
-    def test_preprocess_frame_custom_size(self):
+    def test_preprocess_frame_custom_size(self, verifier, random_frame_1080_1920):
         """Test preprocessing with custom target size"""
-        verifier = CVVerifier()
-        
-        # Create a test frame
-        original_frame = np.random.randint(0, 255, (1080, 1920, 3), dtype=np.uint8)
-        
-        # Preprocess with custom size
+        # Preprocess a 1080p frame with custom size
         target_size = (320, 240)
-        processed = verifier.preprocess_frame(original_frame, target_size=target_size)
+        processed = verifier.preprocess_frame(random_frame_1080_1920, target_size=target_size)
         
         # Verify dimensions (height, width, channels)
         assert processed.shape == (240, 320, 3)
     
-    def test_preprocess_frame_converts_bgr_to_rgb(self):
+    def test_preprocess_frame_converts_bgr_to_rgb(self, verifier):
         """Test that BGR frames are converted to RGB"""
-        verifier = CVVerifier()
-        
         # Create a test frame with distinct BGR values
         # Blue channel = 255, Green = 0, Red = 0
         bgr_frame = np.zeros((480, 640, 3), dtype=np.uint8)
@@ -89,23 +236,29 @@ class TestFramePreprocessing:
         assert rgb_frame[0, 0, 1] == 0    # Green
         assert rgb_frame[0, 0, 2] == 255  # Blue
     
-    def test_preprocess_frame_maintains_data_type(self):
+    def test_preprocess_frame_maintains_data_type(self, verifier, blank_frame):
         """Test that preprocessing maintains uint8 data type"""
-        verifier = CVVerifier()
-        
-        original_frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
-        processed = verifier.preprocess_frame(original_frame)
-        
+        processed = verifier.preprocess_frame(blank_frame)
+
         assert processed.dtype == np.uint8
+
+    def test_preprocess_frame_at_target_size_leaves_input_untouched(self, verifier):
+        """Test that a frame already at target size is converted without mutating the input"""
+
+        bgr_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        bgr_frame[:, :, 0] = 255
+
+        rgb_frame = verifier.preprocess_frame(bgr_frame, target_size=(640, 480))
+
+        assert rgb_frame is not bgr_frame
+        assert bgr_frame[0, 0, 0] == 255
+        assert rgb_frame[0, 0, 2] == 255
     
-    def test_preprocess_frame_with_real_image(self):
+    def test_preprocess_frame_with_real_image(self, verifier):
         """Test preprocessing with a real-looking image"""
-        verifier = CVVerifier()
-        
         # Create a simple gradient image
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        for i in range(480):
-            frame[i, :, :] = i // 2  # Gradient from dark to light
+        frame = np.empty((480, 640, 3), dtype=np.uint8)
+        frame[:] = (np.arange(480) // 2).astype(np.uint8)[:, None, None]  # Gradient from dark to light
         
         processed = verifier.preprocess_frame(frame, target_size=(320, 240))
         
@@ -134,61 +287,48 @@ class TestCVVerifierCleanup:
 class TestCVVerifierPlaceholderMethods:
     """Test that placeholder methods raise NotImplementedError"""
     
-    def test_compute_liveness_score_implemented(self, mocker):
+    def test_compute_liveness_score_implemented(self, mocker, blank_frame):
         """Test that compute_liveness_score is now implemented"""
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Mock the face_landmarker to avoid loading actual model
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        mock_result.face_landmarks = []  # No face detected
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: NO_FACE)
         
         # Mock detect_micro_movements
         mocker.patch.object(verifier, 'detect_micro_movements', return_value=0.0)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        frames = [blank_frame]
         
         # Should return a score, not raise NotImplementedError
         score = verifier.compute_liveness_score(frames)
-        assert isinstance(score, float)
-        assert 0.0 <= score <= 1.0
+        _assert_unit_float(score)
     
-    def test_verify_challenge_implemented(self):
+    def test_verify_challenge_implemented(self, blank_frame):
         """Test that verify_challenge is now implemented"""
         verifier = CVVerifier(model_path="dummy_path.task")
-        challenge = Challenge(
-            challenge_id="test_session_gesture_0_nod_up",
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        challenge = NOD_UP_CHALLENGE
+        frames = [blank_frame]
         
         # Should return a ChallengeResult, not raise NotImplementedError
         result = verifier.verify_challenge(challenge, frames)
         assert isinstance(result, ChallengeResult)
         assert result.challenge_id == challenge.challenge_id
         assert isinstance(result.completed, bool)
-        assert isinstance(result.confidence, float)
-        assert 0.0 <= result.confidence <= 1.0
+        _assert_unit_float(result.confidence)
         assert isinstance(result.timestamp, float)
     
     def test_detect_3d_depth_implemented(self):
         """Test that detect_3d_depth is now implemented"""
         verifier = CVVerifier()
-        landmarks = np.zeros((468, 3))
         
         # Should return a score, not raise NotImplementedError
-        score = verifier.detect_3d_depth(landmarks)
-        assert isinstance(score, float)
-        assert 0.0 <= score <= 1.0
+        score = verifier.detect_3d_depth(ZERO_LANDMARKS)
+        _assert_unit_float(score)
     
-    def test_detect_micro_movements_requires_model(self):
+    def test_detect_micro_movements_requires_model(self, blank_frame):
         """Test that detect_micro_movements requires model to be loaded"""
         verifier = CVVerifier()
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         
         # Should raise ValueError when trying to access face_landmarker without model
         with pytest.raises(ValueError, match="Model path must be provided"):
@@ -201,7 +341,12 @@ class Test3DDepthDetection:
     Validates Requirement 3.2: Detect 3D depth cues to distinguish live faces from flat images
     """
     
-    def test_flat_image_scores_low(self):
+    @pytest.fixture(scope="class")
+    def verifier(self):
+        """CVVerifier shared by the class (detect_3d_depth keeps no state)"""
+        return CVVerifier()
+    
+    def test_flat_image_scores_low(self, verifier):
         """
         Test that flat image (no depth variation) scores low.
         
@@ -210,10 +355,8 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
         # Create flat landmarks - all at same z-depth (0.0)
-        flat_landmarks = np.random.rand(468, 3)
+        flat_landmarks = RNG.random((468, 3))
         flat_landmarks[:, 2] = 0.0  # All z-coordinates are 0 (flat)
         
         score = verifier.detect_3d_depth(flat_landmarks)
@@ -221,7 +364,7 @@ class Test3DDepthDetection:
         # Flat image should score low (< 0.3)
         assert 0.0 <= score <= 0.3, f"Flat image scored {score}, expected <= 0.3"
     
-    def test_3d_face_scores_high(self):
+    def test_3d_face_scores_high(self, verifier):
         """
         Test that 3D face (with depth variation) scores high.
         
@@ -232,14 +375,12 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
         # Create realistic 3D face landmarks
-        landmarks_3d = np.random.rand(468, 3)
+        landmarks_3d = RNG.random((468, 3))
         
         # Add realistic z-depth variation
         # Most face points at z=0.0
-        landmarks_3d[:, 2] = np.random.normal(0.0, 0.01, 468)
+        landmarks_3d[:, 2] = RNG.normal(0.0, 0.01, 468)
         
         # Nose tip (landmark 1) protrudes forward
         landmarks_3d[1, 2] = 0.04  # Significant protrusion
@@ -257,7 +398,7 @@ class Test3DDepthDetection:
         # 3D face should score high (> 0.5)
         assert 0.5 <= score <= 1.0, f"3D face scored {score}, expected >= 0.5"
     
-    def test_insufficient_landmarks_returns_zero(self):
+    def test_insufficient_landmarks_returns_zero(self, verifier):
         """
         Test that insufficient landmarks returns 0.0 score.
         
@@ -266,16 +407,21 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
         # Create landmarks with insufficient points
-        insufficient_landmarks = np.random.rand(100, 3)
+        insufficient_landmarks = RNG.random((100, 3))
         
         score = verifier.detect_3d_depth(insufficient_landmarks)
         
         assert score == 0.0, f"Insufficient landmarks scored {score}, expected 0.0"
     
-    def test_score_range_validity(self):
+    @pytest.mark.parametrize("make_landmarks", [
+        lambda: ZERO_LANDMARKS,                     # All zeros
+        lambda: np.ones((468, 3)),                  # All ones
+        lambda: RNG.random((468, 3)) * 10,          # Large values
+        lambda: RNG.random((468, 3)) * -10,         # Negative values
+        lambda: RNG.standard_normal((468, 3)),      # Normal distribution
+    ], ids=["zeros", "ones", "large", "negative", "normal"])
+    def test_score_range_validity(self, verifier, make_landmarks):
         """
         Test that depth score is always in valid range [0.0, 1.0].
         
@@ -283,22 +429,10 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
-        # Test with various extreme inputs
-        test_cases = [
-            np.zeros((468, 3)),                           # All zeros
-            np.ones((468, 3)),                            # All ones
-            np.random.rand(468, 3) * 10,                  # Large values
-            np.random.rand(468, 3) * -10,                 # Negative values
-            np.random.randn(468, 3),                      # Normal distribution
-        ]
-        
-        for landmarks in test_cases:
-            score = verifier.detect_3d_depth(landmarks)
-            assert 0.0 <= score <= 1.0, f"Score {score} out of range for input"
+        score = verifier.detect_3d_depth(make_landmarks())
+        assert 0.0 <= score <= 1.0, f"Score {score} out of range for input"
     
-    def test_nose_protrusion_detection(self):
+    def test_nose_protrusion_detection(self, verifier):
         """
         Test that nose protrusion is correctly detected.
         
@@ -307,33 +441,23 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
-        # Create landmarks with prominent nose protrusion
-        landmarks = np.zeros((468, 3))
+        # Flat face (eyes, mouth, chin and forehead all at z=0) whose
+        # nose tip protrudes significantly
+        landmarks_with_protrusion = np.zeros((468, 3))
+        landmarks_with_protrusion[1, 2] = 0.05
         
-        # Set key facial landmarks at z=0
-        landmarks[33, 2] = 0.0   # Left eye
-        landmarks[263, 2] = 0.0  # Right eye
-        landmarks[61, 2] = 0.0   # Left mouth
-        landmarks[291, 2] = 0.0  # Right mouth
-        landmarks[152, 2] = 0.0  # Chin
-        landmarks[10, 2] = 0.0   # Forehead
+        # Same face with the nose tip flattened into the face plane
+        landmarks_without_protrusion = landmarks_with_protrusion.copy()
+        landmarks_without_protrusion[1, 2] = 0.0
         
-        # Nose tip protrudes significantly
-        landmarks[1, 2] = 0.05
-        
-        score_with_protrusion = verifier.detect_3d_depth(landmarks)
-        
-        # Now test without protrusion
-        landmarks[1, 2] = 0.0
-        score_without_protrusion = verifier.detect_3d_depth(landmarks)
+        score_with_protrusion = verifier.detect_3d_depth(landmarks_with_protrusion)
+        score_without_protrusion = verifier.detect_3d_depth(landmarks_without_protrusion)
         
         # Score with protrusion should be higher
         assert score_with_protrusion > score_without_protrusion, \
             f"Nose protrusion should increase score: {score_with_protrusion} vs {score_without_protrusion}"
     
-    def test_z_variance_contribution(self):
+    def test_z_variance_contribution(self, verifier):
         """
         Test that z-coordinate variance contributes to depth score.
         
@@ -341,15 +465,13 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
         # High variance case
-        high_variance_landmarks = np.random.rand(468, 3)
-        high_variance_landmarks[:, 2] = np.random.uniform(-0.05, 0.05, 468)
+        high_variance_landmarks = RNG.random((468, 3))
+        high_variance_landmarks[:, 2] = RNG.uniform(-0.05, 0.05, 468)
         
         # Low variance case
-        low_variance_landmarks = np.random.rand(468, 3)
-        low_variance_landmarks[:, 2] = np.random.uniform(-0.001, 0.001, 468)
+        low_variance_landmarks = RNG.random((468, 3))
+        low_variance_landmarks[:, 2] = RNG.uniform(-0.001, 0.001, 468)
         
         high_score = verifier.detect_3d_depth(high_variance_landmarks)
         low_score = verifier.detect_3d_depth(low_variance_landmarks)
@@ -358,7 +480,7 @@ class Test3DDepthDetection:
         assert high_score > low_score, \
             f"High variance should increase score: {high_score} vs {low_score}"
     
-    def test_realistic_face_geometry(self):
+    def test_realistic_face_geometry(self, verifier):
         """
         Test with realistic face geometry proportions.
         
@@ -366,8 +488,6 @@ class Test3DDepthDetection:
         
         Validates Requirement 3.2
         """
-        verifier = CVVerifier()
-        
         # Create realistic face landmarks
         landmarks = np.zeros((468, 3))
         
@@ -392,13 +512,12 @@ class Test3DDepthDetection:
         landmarks[10] = [0.5, 0.2, 0.008]
         
         # Fill remaining landmarks with slight variation
-        for i in range(468):
-            if i not in [1, 10, 33, 61, 152, 263, 291]:
-                landmarks[i] = [
-                    np.random.uniform(0.2, 0.8),
-                    np.random.uniform(0.2, 0.8),
-                    np.random.normal(0.0, 0.01)
-                ]
+        rest = np.ones(468, dtype=bool)
+        rest[[1, 10, 33, 61, 152, 263, 291]] = False
+        n_rest = int(rest.sum())
+        landmarks[rest, 0] = RNG.uniform(0.2, 0.8, n_rest)
+        landmarks[rest, 1] = RNG.uniform(0.2, 0.8, n_rest)
+        landmarks[rest, 2] = RNG.normal(0.0, 0.01, n_rest)
         
         score = verifier.detect_3d_depth(landmarks)
         
@@ -408,6 +527,25 @@ class Test3DDepthDetection:
 
 
 
+def _eye_blink_sequence(base_landmarks):
+    """10-frame sequence with an eye blink in frames 3-5"""
+    landmark_sequence = _landmark_sequence(base_landmarks, 10)
+    # Move eyelids closer
+    # Left eye: 159 (top), 145 (bottom); right eye: 386 (top), 374 (bottom)
+    landmark_sequence[3:6, [159, 386], 1] += 0.015
+    landmark_sequence[3:6, [145, 374], 1] -= 0.015
+    return landmark_sequence
+
+
+def _head_motion_sequence(base_landmarks):
+    """10-frame sequence with subtle sinusoidal head motion"""
+    landmark_sequence = _landmark_sequence(base_landmarks, 10)
+    phase = np.arange(10) * 0.3
+    landmark_sequence[:, :, 0] += (np.sin(phase) * 0.008)[:, None]
+    landmark_sequence[:, :, 1] += (np.cos(phase) * 0.006)[:, None]
+    return landmark_sequence
+
+
 class TestMicroMovementDetection:
     """
     Unit tests for micro-movement detection functionality.
@@ -417,7 +555,7 @@ class TestMicroMovementDetection:
     without requiring the actual model file.
     """
     
-    def test_insufficient_frames_returns_zero(self):
+    def test_insufficient_frames_returns_zero(self, blank_frame):
         """
         Test that fewer than 2 frames returns 0.0 score.
         
@@ -428,7 +566,7 @@ class TestMicroMovementDetection:
         verifier = CVVerifier()
         
         # Single frame
-        single_frame = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        single_frame = [blank_frame]
         score = verifier.detect_micro_movements(single_frame)
         assert score == 0.0, f"Single frame scored {score}, expected 0.0"
         
@@ -437,7 +575,7 @@ class TestMicroMovementDetection:
         score = verifier.detect_micro_movements(empty_sequence)
         assert score == 0.0, f"Empty sequence scored {score}, expected 0.0"
     
-    def test_static_frames_score_low(self, mocker):
+    def test_static_frames_score_low(self, blank_frame):
         """
         Test that static frames (no movement) score low.
         
@@ -451,36 +589,23 @@ class TestMicroMovementDetection:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Create static landmarks (no movement between frames)
-        static_landmarks = self._create_realistic_landmarks()
+        static_landmarks = _create_realistic_landmarks()
         
         # Mock the face_landmarker to return identical landmarks for all frames
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        # Create mock landmarks with MediaPipe structure
-        mock_face_landmarks = []
-        for x, y, z in static_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = x
-            mock_landmark.y = y
-            mock_landmark.z = z
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
+        result = _detection_result(static_landmarks)
         
         # Replace the face_landmarker with our mock
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: result)
         
         # Create multiple identical frames
-        static_frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(10)]
+        static_frames = _frame_views(blank_frame, 10)
         
         score = verifier.detect_micro_movements(static_frames)
         
         # Static frames should score low (< 0.3)
         assert 0.0 <= score <= 0.3, f"Static frames scored {score}, expected <= 0.3"
     
-    def test_dynamic_frames_score_high(self, mocker):
+    def test_dynamic_frames_score_high(self, blank_frame):
         """
         Test that dynamic frames (with natural movement) score high.
         
@@ -496,73 +621,34 @@ class TestMicroMovementDetection:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Create sequence of landmarks with natural movements
-        base_landmarks = self._create_realistic_landmarks()
+        base_landmarks = _create_realistic_landmarks()
         
-        # Mock the face_landmarker to return varying landmarks
-        mock_landmarker = mocker.MagicMock()
+        # Create a (frames, landmarks, xyz) sequence with natural variations
+        landmark_sequence = _landmark_sequence(base_landmarks, 10)
         
-        # Create a sequence of landmark sets with natural variations
-        landmark_sequence = []
-        for frame_idx in range(10):
-            # Add natural variations
-            frame_landmarks = base_landmarks.copy()
-            
-            # Simulate eye blink (frames 3-5)
-            if 3 <= frame_idx <= 5:
-                # Close eyes by reducing vertical distance
-                # Left eye: 159 (top), 145 (bottom)
-                frame_landmarks[159][1] += 0.01  # Move top down
-                frame_landmarks[145][1] -= 0.01  # Move bottom up
-                # Right eye: 386 (top), 374 (bottom)
-                frame_landmarks[386][1] += 0.01
-                frame_landmarks[374][1] -= 0.01
-            
-            # Simulate subtle head motion
-            head_offset = np.sin(frame_idx * 0.5) * 0.005
-            frame_landmarks[:, 0] += head_offset  # Slight horizontal movement
-            
-            # Add natural jitter
-            jitter = np.random.normal(0, 0.0001, frame_landmarks.shape)
-            frame_landmarks += jitter
-            
-            landmark_sequence.append(frame_landmarks)
+        # Simulate eye blink (frames 3-5) by reducing vertical eye distance
+        # Left eye: 159 (top), 145 (bottom); right eye: 386 (top), 374 (bottom)
+        landmark_sequence[3:6, [159, 386], 1] += 0.01  # Move tops down
+        landmark_sequence[3:6, [145, 374], 1] -= 0.01  # Move bottoms up
         
-        # Configure mock to return different landmarks for each call
-        def mock_detect(mp_image):
-            # Get the next landmark set from sequence
-            if not hasattr(mock_detect, 'call_count'):
-                mock_detect.call_count = 0
-            
-            idx = mock_detect.call_count % len(landmark_sequence)
-            mock_detect.call_count += 1
-            
-            landmarks = landmark_sequence[idx]
-            
-            # Create mock landmarks with MediaPipe structure
-            mock_face_landmarks = []
-            for x, y, z in landmarks:
-                mock_landmark = mocker.MagicMock()
-                mock_landmark.x = float(x)
-                mock_landmark.y = float(y)
-                mock_landmark.z = float(z)
-                mock_face_landmarks.append(mock_landmark)
-            
-            mock_result = mocker.MagicMock()
-            mock_result.face_landmarks = [mock_face_landmarks]
-            return mock_result
+        # Simulate subtle head motion (slight horizontal movement)
+        landmark_sequence[:, :, 0] += (np.sin(np.arange(10) * 0.5) * 0.005)[:, None]
+        
+        # Add natural jitter
+        landmark_sequence += RNG.normal(0, 0.0001, landmark_sequence.shape)
         
-        mock_landmarker.detect = mock_detect
-        verifier._face_landmarker = mock_landmarker
+        # Configure mock to return different landmarks for each call
+        verifier._face_landmarker = _sequence_landmarker(landmark_sequence)
         
         # Create frames
-        dynamic_frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(10)]
+        dynamic_frames = _frame_views(blank_frame, 10)
         
         score = verifier.detect_micro_movements(dynamic_frames)
         
         # Dynamic frames with natural movement should score high (> 0.5)
         assert 0.5 <= score <= 1.0, f"Dynamic frames scored {score}, expected >= 0.5"
     
-    def test_no_face_detected_returns_zero(self, mocker):
+    def test_no_face_detected_returns_zero(self, blank_frame):
         """
         Test that frames with no face detected return 0.0 score.
         
@@ -574,246 +660,71 @@ class TestMicroMovementDetection:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Mock the face_landmarker to return no face detected
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        mock_result.face_landmarks = []  # No face detected
-        mock_landmarker.detect.return_value = mock_result
-        
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: NO_FACE)
         
         # Create frames
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         
         score = verifier.detect_micro_movements(frames)
         
         assert score == 0.0, f"No face detected scored {score}, expected 0.0"
     
-    def test_score_range_validity(self, mocker):
-        """
-        Test that movement score is always in valid range [0.0, 1.0].
-        
-        Regardless of input, the score should never exceed the valid range.
-        
-        Validates Requirement 3.3
-        """
-        verifier = CVVerifier(model_path="dummy_path.task")
-        
-        # Create landmarks with extreme values
-        extreme_landmarks = self._create_realistic_landmarks()
-        
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        
-        # Test with various extreme movement patterns
-        test_cases = [
+    @pytest.mark.parametrize(
+        "make_sequence",
+        [
             # Very large movements
-            [extreme_landmarks + i * 0.1 for i in range(5)],
+            lambda landmarks: landmarks + (np.arange(5) * 0.1)[:, None, None],
             # Very small movements
-            [extreme_landmarks + i * 0.00001 for i in range(5)],
+            lambda landmarks: landmarks + (np.arange(5) * 0.00001)[:, None, None],
             # Random movements
-            [extreme_landmarks + np.random.randn(*extreme_landmarks.shape) * 0.01 for _ in range(5)],
-        ]
-        
-        for landmark_sequence in test_cases:
-            def mock_detect(mp_image):
-                if not hasattr(mock_detect, 'call_count'):
-                    mock_detect.call_count = 0
-                
-                idx = mock_detect.call_count % len(landmark_sequence)
-                mock_detect.call_count += 1
-                
-                landmarks = landmark_sequence[idx]
-                
-                mock_face_landmarks = []
-                for x, y, z in landmarks:
-                    mock_landmark = mocker.MagicMock()
-                    mock_landmark.x = float(x)
-                    mock_landmark.y = float(y)
-                    mock_landmark.z = float(z)
-                    mock_face_landmarks.append(mock_landmark)
-                
-                mock_result = mocker.MagicMock()
-                mock_result.face_landmarks = [mock_face_landmarks]
-                return mock_result
-            
-            mock_landmarker.detect = mock_detect
-            verifier._face_landmarker = mock_landmarker
-            
-            frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(len(landmark_sequence))]
-            score = verifier.detect_micro_movements(frames)
-            
-            assert 0.0 <= score <= 1.0, f"Score {score} out of range [0.0, 1.0]"
-    
-    def test_eye_blink_detection(self, mocker):
+            lambda landmarks: landmarks + RNG.standard_normal((5, *landmarks.shape)) * 0.01,
+        ],
+        ids=["large", "small", "random"],
+    )
+    def test_score_range_validity(self, blank_frame, make_sequence):
         """
-        Test that eye blinks are detected and contribute to movement score.
+        Test that movement score is always in valid range [0.0, 1.0].
         
-        Eye blinks cause changes in Eye Aspect Ratio (EAR) which should
-        be detected as natural micro-movement.
+        Regardless of input, the score should never exceed the valid range.
         
         Validates Requirement 3.3
         """
         verifier = CVVerifier(model_path="dummy_path.task")
         
-        base_landmarks = self._create_realistic_landmarks()
-        
-        # Create sequence with eye blink
-        landmark_sequence = []
-        for frame_idx in range(10):
-            frame_landmarks = base_landmarks.copy()
-            
-            # Simulate blink in middle frames (3-5)
-            if 3 <= frame_idx <= 5:
-                # Close eyes by moving top and bottom eyelids closer
-                # Left eye: 159 (top), 145 (bottom)
-                frame_landmarks[159][1] += 0.015
-                frame_landmarks[145][1] -= 0.015
-                # Right eye: 386 (top), 374 (bottom)
-                frame_landmarks[386][1] += 0.015
-                frame_landmarks[374][1] -= 0.015
-            
-            landmark_sequence.append(frame_landmarks)
-        
-        # Mock landmarker
-        mock_landmarker = mocker.MagicMock()
+        landmark_sequence = make_sequence(_create_realistic_landmarks())
+        verifier._face_landmarker = _sequence_landmarker(landmark_sequence)
         
-        def mock_detect(mp_image):
-            if not hasattr(mock_detect, 'call_count'):
-                mock_detect.call_count = 0
-            
-            idx = mock_detect.call_count % len(landmark_sequence)
-            mock_detect.call_count += 1
-            
-            landmarks = landmark_sequence[idx]
-            
-            mock_face_landmarks = []
-            for x, y, z in landmarks:
-                mock_landmark = mocker.MagicMock()
-                mock_landmark.x = float(x)
-                mock_landmark.y = float(y)
-                mock_landmark.z = float(z)
-                mock_face_landmarks.append(mock_landmark)
-            
-            mock_result = mocker.MagicMock()
-            mock_result.face_landmarks = [mock_face_landmarks]
-            return mock_result
-        
-        mock_landmarker.detect = mock_detect
-        verifier._face_landmarker = mock_landmarker
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(10)]
-        score_with_blink = verifier.detect_micro_movements(frames)
+        frames = _frame_views(blank_frame, len(landmark_sequence))
+        score = verifier.detect_micro_movements(frames)
         
-        # Score with blink should be higher than static
-        # (We know static scores low from previous test)
-        assert score_with_blink > 0.2, \
-            f"Eye blink should increase score, got {score_with_blink}"
+        assert 0.0 <= score <= 1.0, f"Score {score} out of range [0.0, 1.0]"
     
-    def test_head_motion_detection(self, mocker):
+    @pytest.mark.parametrize(
+        "perturb",
+        [_eye_blink_sequence, _head_motion_sequence],
+        ids=["eye_blink", "head_motion"],
+    )
+    def test_natural_movement_detection(self, blank_frame, perturb):
         """
-        Test that subtle head motion is detected.
+        Test that eye blinks and subtle head motion are detected.
         
-        Natural head motion (even when trying to stay still) should
+        Eye blinks change the Eye Aspect Ratio (EAR), and natural head motion
+        (even when trying to stay still) shifts every landmark; both should
         contribute to the movement score.
         
         Validates Requirement 3.3
         """
         verifier = CVVerifier(model_path="dummy_path.task")
         
-        base_landmarks = self._create_realistic_landmarks()
-        
-        # Create sequence with head motion
-        landmark_sequence = []
-        for frame_idx in range(10):
-            frame_landmarks = base_landmarks.copy()
-            
-            # Simulate subtle head motion (sinusoidal movement)
-            offset_x = np.sin(frame_idx * 0.3) * 0.008
-            offset_y = np.cos(frame_idx * 0.3) * 0.006
-            
-            frame_landmarks[:, 0] += offset_x
-            frame_landmarks[:, 1] += offset_y
-            
-            landmark_sequence.append(frame_landmarks)
-        
-        # Mock landmarker
-        mock_landmarker = mocker.MagicMock()
-        
-        def mock_detect(mp_image):
-            if not hasattr(mock_detect, 'call_count'):
-                mock_detect.call_count = 0
-            
-            idx = mock_detect.call_count % len(landmark_sequence)
-            mock_detect.call_count += 1
-            
-            landmarks = landmark_sequence[idx]
-            
-            mock_face_landmarks = []
-            for x, y, z in landmarks:
-                mock_landmark = mocker.MagicMock()
-                mock_landmark.x = float(x)
-                mock_landmark.y = float(y)
-                mock_landmark.z = float(z)
-                mock_face_landmarks.append(mock_landmark)
-            
-            mock_result = mocker.MagicMock()
-            mock_result.face_landmarks = [mock_face_landmarks]
-            return mock_result
-        
-        mock_landmarker.detect = mock_detect
-        verifier._face_landmarker = mock_landmarker
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(10)]
-        score_with_motion = verifier.detect_micro_movements(frames)
-        
-        # Score with head motion should be elevated
-        assert score_with_motion > 0.2, \
-            f"Head motion should increase score, got {score_with_motion}"
-    
-    @staticmethod
-    def _create_realistic_landmarks():
-        """
-        Helper method to create realistic facial landmarks.
-        
-        Returns a 468x3 array with realistic normalized coordinates
-        for a frontal face view.
-        """
-        landmarks = np.zeros((468, 3))
+        landmark_sequence = perturb(_create_realistic_landmarks())
+        verifier._face_landmarker = _sequence_landmarker(landmark_sequence)
         
-        # Set key landmarks with realistic positions
-        # Eyes
-        landmarks[33] = [0.35, 0.4, 0.01]   # Left eye outer
-        landmarks[133] = [0.42, 0.4, 0.01]  # Left eye inner
-        landmarks[159] = [0.385, 0.38, 0.01] # Left eye top
-        landmarks[145] = [0.385, 0.42, 0.01] # Left eye bottom
-        
-        landmarks[263] = [0.58, 0.4, 0.01]  # Right eye inner
-        landmarks[362] = [0.65, 0.4, 0.01]  # Right eye outer
-        landmarks[386] = [0.615, 0.38, 0.01] # Right eye top
-        landmarks[374] = [0.615, 0.42, 0.01] # Right eye bottom
-        
-        # Nose
-        landmarks[1] = [0.5, 0.5, 0.03]     # Nose tip
-        
-        # Mouth
-        landmarks[61] = [0.4, 0.65, 0.015]  # Left mouth
-        landmarks[291] = [0.6, 0.65, 0.015] # Right mouth
-        
-        # Chin and forehead
-        landmarks[152] = [0.5, 0.8, -0.005] # Chin
-        landmarks[10] = [0.5, 0.2, 0.008]   # Forehead
-        
-        # Fill remaining landmarks with random but realistic values
-        for i in range(468):
-            if np.all(landmarks[i] == 0):
-                landmarks[i] = [
-                    np.random.uniform(0.2, 0.8),
-                    np.random.uniform(0.2, 0.8),
-                    np.random.normal(0.0, 0.01)
-                ]
+        frames = _frame_views(blank_frame, len(landmark_sequence))
+        score = verifier.detect_micro_movements(frames)
         
-        return landmarks
-
+        # Score with movement should be higher than static
+        # (We know static scores low from previous test)
+        assert score > 0.2, f"{perturb.__name__} should increase score, got {score}"
 
 
 class TestComputeLivenessScore:
@@ -822,6 +733,19 @@ class TestComputeLivenessScore:
     Validates Requirement 3.4: Output liveness score between 0.0 and 1.0
     """
     
+    @pytest.fixture(scope="class")
+    def base_landmarks(self):
+        """Realistic landmarks shared by the class (read-only)"""
+        return _create_realistic_landmarks()
+    
+    @pytest.fixture
+    def mocked_verifier(self, base_landmarks):
+        """CVVerifier whose landmarker finds base_landmarks in every frame"""
+        verifier = CVVerifier(model_path="dummy_path.task")
+        result = _detection_result(base_landmarks)
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: result)
+        return verifier
+    
     def test_empty_frames_returns_zero(self):
         """
         Test that empty frame list returns 0.0 score.
@@ -838,7 +762,7 @@ class TestComputeLivenessScore:
         score = verifier.compute_liveness_score(empty_frames)
         assert score == 0.0, f"Empty frames scored {score}, expected 0.0"
     
-    def test_combines_depth_and_movement_scores(self, mocker):
+    def test_combines_depth_and_movement_scores(self, mocker, blank_frame, mocked_verifier):
         """
         Test that liveness score combines depth and movement scores.
         
@@ -848,7 +772,7 @@ class TestComputeLivenessScore:
         
         Validates Requirement 3.4
         """
-        verifier = CVVerifier(model_path="dummy_path.task")
+        verifier = mocked_verifier
         
         # Mock detect_3d_depth to return known value
         mock_depth_score = 0.8
@@ -858,28 +782,8 @@ class TestComputeLivenessScore:
         mock_movement_score = 0.6
         mocker.patch.object(verifier, 'detect_micro_movements', return_value=mock_movement_score)
         
-        # Create realistic landmarks for face detection
-        base_landmarks = self._create_realistic_landmarks()
-        
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        # Create mock landmarks with MediaPipe structure
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
-        
         # Create frames
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         
         score = verifier.compute_liveness_score(frames)
         
@@ -888,7 +792,14 @@ class TestComputeLivenessScore:
         assert abs(score - expected_score) < 0.001, \
             f"Score {score} doesn't match expected {expected_score}"
     
-    def test_score_range_validity(self, mocker):
+    @pytest.mark.parametrize("depth_score,movement_score", [
+        (0.0, 0.0),   # Both zero
+        (1.0, 1.0),   # Both max
+        (0.0, 1.0),   # Mixed
+        (1.0, 0.0),   # Mixed
+        (0.5, 0.5),   # Middle
+    ])
+    def test_score_range_validity(self, mocker, blank_frame, mocked_verifier, depth_score, movement_score):
         """
         Test that liveness score is always in valid range [0.0, 1.0].
         
@@ -896,47 +807,17 @@ class TestComputeLivenessScore:
         
         Validates Requirement 3.4
         """
-        verifier = CVVerifier(model_path="dummy_path.task")
-        
-        # Create realistic landmarks
-        base_landmarks = self._create_realistic_landmarks()
+        verifier = mocked_verifier
+        mocker.patch.object(verifier, 'detect_3d_depth', return_value=depth_score)
+        mocker.patch.object(verifier, 'detect_micro_movements', return_value=movement_score)
         
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
-        
-        # Test with various extreme depth and movement scores
-        test_cases = [
-            (0.0, 0.0),   # Both zero
-            (1.0, 1.0),   # Both max
-            (0.0, 1.0),   # Mixed
-            (1.0, 0.0),   # Mixed
-            (0.5, 0.5),   # Middle
-        ]
+        frames = _frame_views(blank_frame, 5)
+        score = verifier.compute_liveness_score(frames)
         
-        for depth_score, movement_score in test_cases:
-            mocker.patch.object(verifier, 'detect_3d_depth', return_value=depth_score)
-            mocker.patch.object(verifier, 'detect_micro_movements', return_value=movement_score)
-            
-            frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
-            score = verifier.compute_liveness_score(frames)
-            
-            assert 0.0 <= score <= 1.0, \
-                f"Score {score} out of range for depth={depth_score}, movement={movement_score}"
+        assert 0.0 <= score <= 1.0, \
+            f"Score {score} out of range for depth={depth_score}, movement={movement_score}"
     
-    def test_no_face_detected_returns_zero(self, mocker):
+    def test_no_face_detected_returns_zero(self, mocker, blank_frame):
         """
         Test that frames with no face detected return 0.0 score.
         
@@ -948,264 +829,54 @@ class TestComputeLivenessScore:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Mock the face_landmarker to return no face detected
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        mock_result.face_landmarks = []  # No face detected
-        mock_landmarker.detect.return_value = mock_result
-        
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: NO_FACE)
         
         # Mock detect_micro_movements to return 0.0 (no face detected)
         mocker.patch.object(verifier, 'detect_micro_movements', return_value=0.0)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         score = verifier.compute_liveness_score(frames)
         
         # With no face detected, both depth and movement should be 0.0
         assert score == 0.0, f"No face detected scored {score}, expected 0.0"
     
-    def test_high_depth_low_movement_scores_moderate(self, mocker):
-        """
-        Test that high depth but low movement results in moderate score.
-        
-        This simulates a 3D object (like a mask) that has depth but no
-        natural micro-movements.
-        
-        Validates Requirement 3.4
-        """
-        verifier = CVVerifier(model_path="dummy_path.task")
-        
-        # High depth score (3D object)
-        mock_depth_score = 0.9
-        mocker.patch.object(verifier, 'detect_3d_depth', return_value=mock_depth_score)
-        
-        # Low movement score (static)
-        mock_movement_score = 0.1
-        mocker.patch.object(verifier, 'detect_micro_movements', return_value=mock_movement_score)
-        
-        # Create realistic landmarks
-        base_landmarks = self._create_realistic_landmarks()
-        
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
-        score = verifier.compute_liveness_score(frames)
-        
-        # Expected: 0.5 * 0.9 + 0.5 * 0.1 = 0.5
-        expected_score = 0.5 * mock_depth_score + 0.5 * mock_movement_score
-        assert abs(score - expected_score) < 0.001, \
-            f"Score {score} doesn't match expected {expected_score}"
-        
-        # Should be moderate (around 0.5)
-        assert 0.4 <= score <= 0.6, \
-            f"High depth + low movement should score moderate, got {score}"
-    
-    def test_low_depth_high_movement_scores_moderate(self, mocker):
-        """
-        Test that low depth but high movement results in moderate score.
-        
-        This simulates a flat video with movement (like a video on a screen).
-        
-        Validates Requirement 3.4
-        """
-        verifier = CVVerifier(model_path="dummy_path.task")
-        
-        # Low depth score (flat)
-        mock_depth_score = 0.1
-        mocker.patch.object(verifier, 'detect_3d_depth', return_value=mock_depth_score)
-        
-        # High movement score (dynamic)
-        mock_movement_score = 0.9
-        mocker.patch.object(verifier, 'detect_micro_movements', return_value=mock_movement_score)
-        
-        # Create realistic landmarks
-        base_landmarks = self._create_realistic_landmarks()
-        
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
-        score = verifier.compute_liveness_score(frames)
-        
-        # Expected: 0.5 * 0.1 + 0.5 * 0.9 = 0.5
-        expected_score = 0.5 * mock_depth_score + 0.5 * mock_movement_score
-        assert abs(score - expected_score) < 0.001, \
-            f"Score {score} doesn't match expected {expected_score}"
-        
-        # Should be moderate (around 0.5)
-        assert 0.4 <= score <= 0.6, \
-            f"Low depth + high movement should score moderate, got {score}"
-    
-    def test_high_depth_high_movement_scores_high(self, mocker):
-        """
-        Test that high depth and high movement results in high score.
-        
-        This simulates a real live human face with both 3D structure
-        and natural micro-movements.
-        
-        Validates Requirement 3.4
-        """
-        verifier = CVVerifier(model_path="dummy_path.task")
-        
-        # High depth score (3D face)
-        mock_depth_score = 0.9
-        mocker.patch.object(verifier, 'detect_3d_depth', return_value=mock_depth_score)
-        
-        # High movement score (natural movements)
-        mock_movement_score = 0.8
-        mocker.patch.object(verifier, 'detect_micro_movements', return_value=mock_movement_score)
-        
-        # Create realistic landmarks
-        base_landmarks = self._create_realistic_landmarks()
-        
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
-        score = verifier.compute_liveness_score(frames)
-        
-        # Expected: 0.5 * 0.9 + 0.5 * 0.8 = 0.85
-        expected_score = 0.5 * mock_depth_score + 0.5 * mock_movement_score
-        assert abs(score - expected_score) < 0.001, \
-            f"Score {score} doesn't match expected {expected_score}"
-        
-        # Should be high (> 0.7)
-        assert score > 0.7, \
-            f"High depth + high movement should score high, got {score}"
-    
-    def test_low_depth_low_movement_scores_low(self, mocker):
+    @pytest.mark.parametrize("depth_score,movement_score,expected_range", [
+        # 3D object (like a mask) with no natural micro-movements
+        (0.9, 0.1, (0.4, 0.6)),
+        # Flat video with movement (like a video on a screen)
+        (0.1, 0.9, (0.4, 0.6)),
+        # Real live face with 3D structure and natural micro-movements
+        (0.9, 0.8, (0.7, 1.0)),
+        # Static flat image (like a photo)
+        (0.1, 0.1, (0.0, 0.3)),
+    ], ids=[
+        "high_depth_low_movement",
+        "low_depth_high_movement",
+        "high_depth_high_movement",
+        "low_depth_low_movement",
+    ])
+    def test_score_combination(
+        self, mocker, blank_frame, mocked_verifier, depth_score, movement_score, expected_range
+    ):
         """
-        Test that low depth and low movement results in low score.
-        
-        This simulates a static flat image (like a photo).
+        Test that depth and movement combine into the expected score band.
         
         Validates Requirement 3.4
         """
-        verifier = CVVerifier(model_path="dummy_path.task")
-        
-        # Low depth score (flat)
-        mock_depth_score = 0.1
-        mocker.patch.object(verifier, 'detect_3d_depth', return_value=mock_depth_score)
-        
-        # Low movement score (static)
-        mock_movement_score = 0.1
-        mocker.patch.object(verifier, 'detect_micro_movements', return_value=mock_movement_score)
-        
-        # Create realistic landmarks
-        base_landmarks = self._create_realistic_landmarks()
+        verifier = mocked_verifier
+        mocker.patch.object(verifier, 'detect_3d_depth', return_value=depth_score)
+        mocker.patch.object(verifier, 'detect_micro_movements', return_value=movement_score)
         
-        # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         score = verifier.compute_liveness_score(frames)
         
-        # Expected: 0.5 * 0.1 + 0.5 * 0.1 = 0.1
-        expected_score = 0.5 * mock_depth_score + 0.5 * mock_movement_score
+        expected_score = 0.5 * depth_score + 0.5 * movement_score
         assert abs(score - expected_score) < 0.001, \
             f"Score {score} doesn't match expected {expected_score}"
         
-        # Should be low (< 0.3)
-        assert score < 0.3, \
-            f"Low depth + low movement should score low, got {score}"
-    
-    @staticmethod
-    def _create_realistic_landmarks():
-        """
-        Helper method to create realistic facial landmarks.
-        
-        Returns a 468x3 array with realistic normalized coordinates
-        for a frontal face view.
-        """
-        landmarks = np.zeros((468, 3))
-        
-        # Set key landmarks with realistic positions
-        # Eyes
-        landmarks[33] = [0.35, 0.4, 0.01]   # Left eye outer
-        landmarks[133] = [0.42, 0.4, 0.01]  # Left eye inner
-        landmarks[159] = [0.385, 0.38, 0.01] # Left eye top
-        landmarks[145] = [0.385, 0.42, 0.01] # Left eye bottom
-        
-        landmarks[263] = [0.58, 0.4, 0.01]  # Right eye inner
-        landmarks[362] = [0.65, 0.4, 0.01]  # Right eye outer
-        landmarks[386] = [0.615, 0.38, 0.01] # Right eye top
-        landmarks[374] = [0.615, 0.42, 0.01] # Right eye bottom
-        
-        # Nose
-        landmarks[1] = [0.5, 0.5, 0.03]     # Nose tip
-        
-        # Mouth
-        landmarks[61] = [0.4, 0.65, 0.015]  # Left mouth
-        landmarks[291] = [0.6, 0.65, 0.015] # Right mouth
-        
-        # Chin and forehead
-        landmarks[152] = [0.5, 0.8, -0.005] # Chin
-        landmarks[10] = [0.5, 0.2, 0.008]   # Forehead
-        
-        # Fill remaining landmarks with random but realistic values
-        for i in range(468):
-            if np.all(landmarks[i] == 0):
-                landmarks[i] = [
-                    np.random.uniform(0.2, 0.8),
-                    np.random.uniform(0.2, 0.8),
-                    np.random.normal(0.0, 0.01)
-                ]
-        
-        return landmarks
-
+        low, high = expected_range
+        assert low <= score <= high, \
+            f"depth={depth_score}, movement={movement_score} scored {score}, expected [{low}, {high}]"
 
 
 class TestVerifyChallenge:
@@ -1221,12 +892,7 @@ class TestVerifyChallenge:
         Validates Requirement 4.2
         """
         verifier = CVVerifier(model_path="dummy_path.task")
-        challenge = Challenge(
-            challenge_id="test_session_gesture_0_nod_up",
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
+        challenge = NOD_UP_CHALLENGE
         
         result = verifier.verify_challenge(challenge, [])
         
@@ -1235,27 +901,22 @@ class TestVerifyChallenge:
         assert result.confidence == 0.0
         assert isinstance(result.timestamp, float)
     
-    def test_invalid_challenge_id_returns_failed_result(self):
+    def test_invalid_challenge_id_returns_failed_result(self, blank_frame):
         """
         Test that invalid challenge ID format returns failed result.
         
         Validates Requirement 4.2
         """
         verifier = CVVerifier(model_path="dummy_path.task")
-        challenge = Challenge(
-            challenge_id="invalid",  # Invalid format
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        challenge = INVALID_ID_CHALLENGE
+        frames = [blank_frame]
         
         result = verifier.verify_challenge(challenge, frames)
         
         assert result.completed is False
         assert result.confidence == 0.0
     
-    def test_gesture_challenge_routes_to_gesture_verification(self, mocker):
+    def test_gesture_challenge_routes_to_gesture_verification(self, mocker, blank_frame):
         """
         Test that gesture challenges route to _verify_gesture method.
         
@@ -1268,13 +929,8 @@ class TestVerifyChallenge:
             verifier, '_verify_gesture', return_value=(True, 0.85)
         )
         
-        challenge = Challenge(
-            challenge_id="test_session_gesture_0_nod_up",
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        challenge = NOD_UP_CHALLENGE
+        frames = [blank_frame]
         
         result = verifier.verify_challenge(challenge, frames)
         
@@ -1285,7 +941,7 @@ class TestVerifyChallenge:
         assert result.completed is True
         assert result.confidence == 0.85
     
-    def test_expression_challenge_routes_to_expression_verification(self, mocker):
+    def test_expression_challenge_routes_to_expression_verification(self, mocker, blank_frame):
         """
         Test that expression challenges route to _verify_expression method.
         
@@ -1298,13 +954,8 @@ class TestVerifyChallenge:
             verifier, '_verify_expression', return_value=(True, 0.75)
         )
         
-        challenge = Challenge(
-            challenge_id="test_session_expression_0_smile",
-            type=ChallengeType.EXPRESSION,
-            instruction="Smile",
-            timeout_seconds=10
-        )
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        challenge = SMILE_CHALLENGE
+        frames = [blank_frame]
         
         result = verifier.verify_challenge(challenge, frames)
         
@@ -1315,7 +966,7 @@ class TestVerifyChallenge:
         assert result.completed is True
         assert result.confidence == 0.75
     
-    def test_timestamp_recorded_on_completion(self, mocker):
+    def test_timestamp_recorded_on_completion(self, mocker, blank_frame):
         """
         Test that timestamp is recorded on successful completion.
         
@@ -1326,13 +977,8 @@ class TestVerifyChallenge:
         # Mock _verify_gesture to return success
         mocker.patch.object(verifier, '_verify_gesture', return_value=(True, 0.9))
         
-        challenge = Challenge(
-            challenge_id="test_session_gesture_0_nod_up",
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        challenge = NOD_UP_CHALLENGE
+        frames = [blank_frame]
         
         import time
         before_time = time.time()
@@ -1343,7 +989,7 @@ class TestVerifyChallenge:
         assert before_time <= result.timestamp <= after_time
         assert result.completed is True
     
-    def test_confidence_score_in_valid_range(self, mocker):
+    def test_confidence_score_in_valid_range(self, mocker, blank_frame):
         """
         Test that confidence score is always in valid range [0.0, 1.0].
         
@@ -1363,13 +1009,8 @@ class TestVerifyChallenge:
         for completed, confidence in test_cases:
             mocker.patch.object(verifier, '_verify_gesture', return_value=(completed, confidence))
             
-            challenge = Challenge(
-                challenge_id="test_session_gesture_0_nod_up",
-                type=ChallengeType.GESTURE,
-                instruction="Nod your head up",
-                timeout_seconds=10
-            )
-            frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+            challenge = NOD_UP_CHALLENGE
+            frames = [blank_frame]
             
             result = verifier.verify_challenge(challenge, frames)
             
@@ -1383,7 +1024,7 @@ class TestVerifyGesture:
     Validates Requirement 4.2: Gesture detection and verification
     """
     
-    def test_insufficient_frames_returns_false(self):
+    def test_insufficient_frames_returns_false(self, blank_frame):
         """
         Test that fewer than 2 frames returns False.
         
@@ -1394,13 +1035,13 @@ class TestVerifyGesture:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Single frame
-        single_frame = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        single_frame = [blank_frame]
         completed, confidence = verifier._verify_gesture("nod_up", single_frame)
         
         assert completed is False
         assert confidence == 0.0
     
-    def test_no_face_detected_returns_false(self, mocker):
+    def test_no_face_detected_returns_false(self, blank_frame):
         """
         Test that frames with no face detected return False.
         
@@ -1409,19 +1050,15 @@ class TestVerifyGesture:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Mock face_landmarker to return no face
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        mock_result.face_landmarks = []
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: NO_FACE)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("nod_up", frames)
         
         assert completed is False
         assert confidence == 0.0
     
-    def test_nod_up_gesture_detection(self, mocker):
+    def test_nod_up_gesture_detection(self, blank_frame):
         """
         Test that nod up gesture is correctly detected.
         
@@ -1431,26 +1068,21 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing upward head movement
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Move nose and chin up (y decreases)
-            offset = -0.01 * i  # Gradual upward movement
-            frame_landmarks[1][1] += offset  # Nose
-            frame_landmarks[152][1] += offset  # Chin
-            landmark_sequence.append(frame_landmarks)
+        # Move nose and chin up (y decreases) gradually
+        landmark_sequence[:, [1, 152], 1] += (-0.01 * np.arange(5))[:, None]
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        self._mock_face_landmarker(verifier, landmark_sequence)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("nod_up", frames)
         
         # Should detect upward movement
         assert completed is True
         assert confidence > 0.0
     
-    def test_turn_left_gesture_detection(self, mocker):
+    def test_turn_left_gesture_detection(self, blank_frame):
         """
         Test that turn left gesture is correctly detected.
         
@@ -1460,25 +1092,21 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing leftward head turn
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Move nose left (x decreases)
-            offset = -0.015 * i
-            frame_landmarks[1][0] += offset  # Nose
-            landmark_sequence.append(frame_landmarks)
+        # Move nose left (x decreases)
+        landmark_sequence[:, 1, 0] += -0.015 * np.arange(5)
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        self._mock_face_landmarker(verifier, landmark_sequence)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("turn_left", frames)
         
         # Should detect leftward turn
         assert completed is True
         assert confidence > 0.0
     
-    def test_open_mouth_gesture_detection(self, mocker):
+    def test_open_mouth_gesture_detection(self, blank_frame):
         """
         Test that open mouth gesture is correctly detected.
         
@@ -1488,26 +1116,22 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing mouth opening
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Open mouth (increase vertical distance)
-            if i >= 2:  # Open mouth in later frames
-                frame_landmarks[13][1] -= 0.02  # Upper lip up
-                frame_landmarks[14][1] += 0.02  # Lower lip down
-            landmark_sequence.append(frame_landmarks)
+        # Open mouth in later frames (increase vertical distance)
+        landmark_sequence[2:, 13, 1] -= 0.02  # Upper lip up
+        landmark_sequence[2:, 14, 1] += 0.02  # Lower lip down
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        self._mock_face_landmarker(verifier, landmark_sequence)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("open_mouth", frames)
         
         # Should detect mouth opening
         assert completed is True
         assert confidence > 0.0
     
-    def test_blink_gesture_detection(self, mocker):
+    def test_blink_gesture_detection(self, blank_frame):
         """
         Test that blink gesture is correctly detected.
         
@@ -1517,29 +1141,23 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing blink
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
-        
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Close eyes in middle frames
-            if 1 <= i <= 3:
-                # Close eyes (reduce vertical distance)
-                frame_landmarks[159][1] += 0.015  # Left eye top down
-                frame_landmarks[145][1] -= 0.015  # Left eye bottom up
-                frame_landmarks[386][1] += 0.015  # Right eye top down
-                frame_landmarks[374][1] -= 0.015  # Right eye bottom up
-            landmark_sequence.append(frame_landmarks)
-        
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
+        
+        # Close eyes in middle frames (reduce vertical distance)
+        # Left eye: 159 (top), 145 (bottom); right eye: 386 (top), 374 (bottom)
+        landmark_sequence[1:4, [159, 386], 1] += 0.015  # Tops down
+        landmark_sequence[1:4, [145, 374], 1] -= 0.015  # Bottoms up
+        
+        self._mock_face_landmarker(verifier, landmark_sequence)
+        
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("blink", frames)
         
         # Should detect blink
         assert completed is True
         assert confidence > 0.0
     
-    def test_unknown_gesture_returns_false(self, mocker):
+    def test_unknown_gesture_returns_false(self, blank_frame):
         """
         Test that unknown gesture type returns False.
         
@@ -1548,15 +1166,15 @@ class TestVerifyGesture:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         base_landmarks = self._create_realistic_landmarks()
-        self._mock_face_landmarker(verifier, mocker, [base_landmarks] * 5)
+        self._mock_face_landmarker(verifier, [base_landmarks] * 5)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("unknown_gesture", frames)
         
         assert completed is False
         assert confidence == 0.0
     
-    def test_nod_down_gesture_detection(self, mocker):
+    def test_nod_down_gesture_detection(self, blank_frame):
         """
         Test that nod down gesture is correctly detected.
         
@@ -1566,26 +1184,21 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing downward head movement
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Move nose and chin down (y increases)
-            offset = 0.01 * i  # Gradual downward movement
-            frame_landmarks[1][1] += offset  # Nose
-            frame_landmarks[152][1] += offset  # Chin
-            landmark_sequence.append(frame_landmarks)
+        # Move nose and chin down (y increases) gradually
+        landmark_sequence[:, [1, 152], 1] += (0.01 * np.arange(5))[:, None]
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        self._mock_face_landmarker(verifier, landmark_sequence)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("nod_down", frames)
         
         # Should detect downward movement
         assert completed is True
         assert confidence > 0.0
     
-    def test_turn_right_gesture_detection(self, mocker):
+    def test_turn_right_gesture_detection(self, blank_frame):
         """
         Test that turn right gesture is correctly detected.
         
@@ -1595,25 +1208,21 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing rightward head turn
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Move nose right (x increases)
-            offset = 0.015 * i
-            frame_landmarks[1][0] += offset  # Nose
-            landmark_sequence.append(frame_landmarks)
+        # Move nose right (x increases)
+        landmark_sequence[:, 1, 0] += 0.015 * np.arange(5)
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        self._mock_face_landmarker(verifier, landmark_sequence)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("turn_right", frames)
         
         # Should detect rightward turn
         assert completed is True
         assert confidence > 0.0
     
-    def test_tilt_left_gesture_detection(self, mocker):
+    def test_tilt_left_gesture_detection(self, blank_frame):
         """
         Test that tilt left gesture is correctly detected.
         
@@ -1623,7 +1232,7 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing leftward head tilt
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
         # Initial eye positions: left eye at (0.35, 0.4), right eye at (0.65, 0.4)
         # arctan2(dy, dx) where dy = right_y - left_y, dx = right_x - left_x
@@ -1633,29 +1242,25 @@ class TestVerifyGesture:
         # So we need angle to INCREASE (become more positive)
         # This means left eye should go up, right eye should go down!
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Create a significant tilt by rotating the eye line
-            # Tilt angle in radians (need > 0.15 radians ≈ 8.6 degrees)
-            tilt_angle = 0.05 * i  # Gradual tilt up to 0.2 radians (11.5 degrees)
-            
-            # For tilt left to have angle_end > angle_start:
-            # We need dy to increase (right eye goes down relative to left eye)
-            frame_landmarks[33][1] -= tilt_angle   # Left eye up (y decreases)
-            frame_landmarks[263][1] += tilt_angle  # Right eye down (y increases)
-            
-            landmark_sequence.append(frame_landmarks)
+        # Create a significant tilt by rotating the eye line
+        # Tilt angle in radians (need > 0.15 radians ≈ 8.6 degrees)
+        tilt_angle = 0.05 * np.arange(5)  # Gradual tilt up to 0.2 radians (11.5 degrees)
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        # For tilt left to have angle_end > angle_start:
+        # We need dy to increase (right eye goes down relative to left eye)
+        landmark_sequence[:, 33, 1] -= tilt_angle   # Left eye up (y decreases)
+        landmark_sequence[:, 263, 1] += tilt_angle  # Right eye down (y increases)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        self._mock_face_landmarker(verifier, landmark_sequence)
+        
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("tilt_left", frames)
         
         # Should detect leftward tilt
         assert completed is True
         assert confidence > 0.0
     
-    def test_tilt_right_gesture_detection(self, mocker):
+    def test_tilt_right_gesture_detection(self, blank_frame):
         """
         Test that tilt right gesture is correctly detected.
         
@@ -1665,35 +1270,31 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing rightward head tilt
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
         # For tilt right, the code checks if angle_end < angle_start
         # So we need angle to DECREASE (become more negative)
         # This means right eye should go up, left eye should go down
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Create a significant tilt by rotating the eye line
-            # Tilt angle in radians (need > 0.15 radians ≈ 8.6 degrees)
-            tilt_angle = 0.05 * i  # Gradual tilt up to 0.2 radians (11.5 degrees)
-            
-            # For tilt right to have angle_end < angle_start:
-            # We need dy to decrease (right eye goes up relative to left eye)
-            frame_landmarks[263][1] -= tilt_angle  # Right eye up (y decreases)
-            frame_landmarks[33][1] += tilt_angle   # Left eye down (y increases)
-            
-            landmark_sequence.append(frame_landmarks)
+        # Create a significant tilt by rotating the eye line
+        # Tilt angle in radians (need > 0.15 radians ≈ 8.6 degrees)
+        tilt_angle = 0.05 * np.arange(5)  # Gradual tilt up to 0.2 radians (11.5 degrees)
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        # For tilt right to have angle_end < angle_start:
+        # We need dy to decrease (right eye goes up relative to left eye)
+        landmark_sequence[:, 263, 1] -= tilt_angle  # Right eye up (y decreases)
+        landmark_sequence[:, 33, 1] += tilt_angle   # Left eye down (y increases)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        self._mock_face_landmarker(verifier, landmark_sequence)
+        
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("tilt_right", frames)
         
         # Should detect rightward tilt
         assert completed is True
         assert confidence > 0.0
     
-    def test_close_eyes_gesture_detection(self, mocker):
+    def test_close_eyes_gesture_detection(self, blank_frame):
         """
         Test that close eyes gesture is correctly detected.
         
@@ -1703,29 +1304,23 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing eye closing
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
-        
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Close eyes in later frames
-            if i >= 2:
-                # Close eyes (reduce vertical distance significantly)
-                frame_landmarks[159][1] += 0.02  # Left eye top down
-                frame_landmarks[145][1] -= 0.02  # Left eye bottom up
-                frame_landmarks[386][1] += 0.02  # Right eye top down
-                frame_landmarks[374][1] -= 0.02  # Right eye bottom up
-            landmark_sequence.append(frame_landmarks)
-        
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
-        
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
+        
+        # Close eyes in later frames (reduce vertical distance significantly)
+        # Left eye: 159 (top), 145 (bottom); right eye: 386 (top), 374 (bottom)
+        landmark_sequence[2:, [159, 386], 1] += 0.02  # Tops down
+        landmark_sequence[2:, [145, 374], 1] -= 0.02  # Bottoms up
+        
+        self._mock_face_landmarker(verifier, landmark_sequence)
+        
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("close_eyes", frames)
         
         # Should detect eye closing
         assert completed is True
         assert confidence > 0.0
     
-    def test_raise_eyebrows_gesture_detection(self, mocker):
+    def test_raise_eyebrows_gesture_detection(self, blank_frame):
         """
         Test that raise eyebrows gesture is correctly detected.
         
@@ -1735,20 +1330,14 @@ class TestVerifyGesture:
         
         # Create landmark sequence showing eyebrow raising
         base_landmarks = self._create_realistic_landmarks()
-        landmark_sequence = []
+        landmark_sequence = _landmark_sequence(base_landmarks, 5)
         
-        for i in range(5):
-            frame_landmarks = base_landmarks.copy()
-            # Raise eyebrows (move up, y decreases)
-            if i >= 2:
-                offset = -0.03
-                frame_landmarks[70][1] += offset  # Left eyebrow up
-                frame_landmarks[300][1] += offset  # Right eyebrow up
-            landmark_sequence.append(frame_landmarks)
+        # Raise eyebrows in later frames (move up, y decreases)
+        landmark_sequence[2:, [70, 300], 1] -= 0.03  # Left and right eyebrow up
         
-        self._mock_face_landmarker(verifier, mocker, landmark_sequence)
+        self._mock_face_landmarker(verifier, landmark_sequence)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(5)]
+        frames = _frame_views(blank_frame, 5)
         completed, confidence = verifier._verify_gesture("raise_eyebrows", frames)
         
         # Should detect eyebrow raising
@@ -1777,33 +1366,9 @@ class TestVerifyGesture:
         return landmarks
     
     @staticmethod
-    def _mock_face_landmarker(verifier, mocker, landmark_sequence):
+    def _mock_face_landmarker(verifier, landmark_sequence):
         """Helper to mock face landmarker with landmark sequence"""
-        mock_landmarker = mocker.MagicMock()
-        
-        def mock_detect(mp_image):
-            if not hasattr(mock_detect, 'call_count'):
-                mock_detect.call_count = 0
-            
-            idx = mock_detect.call_count % len(landmark_sequence)
-            mock_detect.call_count += 1
-            
-            landmarks = landmark_sequence[idx]
-            
-            mock_face_landmarks = []
-            for x, y, z in landmarks:
-                mock_landmark = mocker.MagicMock()
-                mock_landmark.x = float(x)
-                mock_landmark.y = float(y)
-                mock_landmark.z = float(z)
-                mock_face_landmarks.append(mock_landmark)
-            
-            mock_result = mocker.MagicMock()
-            mock_result.face_landmarks = [mock_face_landmarks]
-            return mock_result
-        
-        mock_landmarker.detect = mock_detect
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _sequence_landmarker(landmark_sequence)
 
 
 class TestChallengeTimeout:
@@ -1812,7 +1377,7 @@ class TestChallengeTimeout:
     Validates Requirement 4.4: Challenge timeout enforcement
     """
     
-    def test_challenge_timeout_10_seconds(self, mocker):
+    def test_challenge_timeout_10_seconds(self):
         """
         Test that challenges have a 10-second timeout.
         
@@ -1822,18 +1387,13 @@ class TestChallengeTimeout:
         Validates Requirement 4.4
         """
         # Create a challenge with default timeout
-        challenge = Challenge(
-            challenge_id="test_session_gesture_0_nod_up",
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
+        challenge = NOD_UP_CHALLENGE
         
         # Verify timeout is set to 10 seconds
         assert challenge.timeout_seconds == 10, \
             f"Challenge timeout should be 10 seconds, got {challenge.timeout_seconds}"
     
-    def test_challenge_timeout_enforced_in_verification(self, mocker):
+    def test_challenge_timeout_enforced_in_verification(self, mocker, blank_frame):
         """
         Test that challenge verification respects the timeout value.
         
@@ -1848,18 +1408,13 @@ class TestChallengeTimeout:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Create challenge with 10-second timeout
-        challenge = Challenge(
-            challenge_id="test_session_gesture_0_nod_up",
-            type=ChallengeType.GESTURE,
-            instruction="Nod your head up",
-            timeout_seconds=10
-        )
+        challenge = NOD_UP_CHALLENGE
         
         # Mock _verify_gesture to simulate a failed attempt (timeout scenario)
         mocker.patch.object(verifier, '_verify_gesture', return_value=(False, 0.0))
         
         # Create frames (simulating video capture during timeout period)
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         
         # Verify challenge
         result = verifier.verify_challenge(challenge, frames)
@@ -1915,7 +1470,7 @@ class TestVerifyExpression:
         assert completed is False
         assert confidence == 0.0
     
-    def test_no_face_detected_returns_false(self, mocker):
+    def test_no_face_detected_returns_false(self, blank_frame):
         """
         Test that frames with no face detected return False.
         
@@ -1924,19 +1479,15 @@ class TestVerifyExpression:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         # Mock face_landmarker to return no face
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        mock_result.face_landmarks = []
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: NO_FACE)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         completed, confidence = verifier._verify_expression("smile", frames)
         
         assert completed is False
         assert confidence == 0.0
     
-    def test_smile_expression_detection(self, mocker):
+    def test_smile_expression_detection(self, blank_frame):
         """
         Test that smile expression is correctly detected.
         
@@ -1952,16 +1503,16 @@ class TestVerifyExpression:
         landmarks[61][0] -= 0.03  # Left mouth corner out (increase width)
         landmarks[291][0] += 0.03  # Right mouth corner out
         
-        self._mock_face_landmarker(verifier, mocker, [landmarks] * 3)
+        self._mock_face_landmarker(verifier, [landmarks] * 3)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         completed, confidence = verifier._verify_expression("smile", frames)
         
         # Should detect smile
         assert completed is True
         assert confidence > 0.0
     
-    def test_surprised_expression_detection(self, mocker):
+    def test_surprised_expression_detection(self, blank_frame):
         """
         Test that surprised expression is correctly detected.
         
@@ -1979,16 +1530,16 @@ class TestVerifyExpression:
         landmarks[13][1] -= 0.02    # Upper lip up
         landmarks[14][1] += 0.02    # Lower lip down
         
-        self._mock_face_landmarker(verifier, mocker, [landmarks] * 3)
+        self._mock_face_landmarker(verifier, [landmarks] * 3)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         completed, confidence = verifier._verify_expression("surprised", frames)
         
         # Should detect surprise
         assert completed is True
         assert confidence > 0.0
     
-    def test_neutral_expression_detection(self, mocker):
+    def test_neutral_expression_detection(self, blank_frame):
         """
         Test that neutral expression is correctly detected.
         
@@ -2002,16 +1553,16 @@ class TestVerifyExpression:
         landmarks[13][1] = 0.64  # Upper lip
         landmarks[14][1] = 0.66  # Lower lip (small opening)
         
-        self._mock_face_landmarker(verifier, mocker, [landmarks] * 3)
+        self._mock_face_landmarker(verifier, [landmarks] * 3)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         completed, confidence = verifier._verify_expression("neutral", frames)
         
         # Should detect neutral
         assert completed is True
         assert confidence > 0.0
     
-    def test_unknown_expression_returns_false(self, mocker):
+    def test_unknown_expression_returns_false(self, mocker, blank_frame):
         """
         Test that unknown expression type returns False.
         
@@ -2020,9 +1571,9 @@ class TestVerifyExpression:
         verifier = CVVerifier(model_path="dummy_path.task")
         
         landmarks = self._create_realistic_landmarks()
-        self._mock_face_landmarker(verifier, mocker, [landmarks] * 3)
+        self._mock_face_landmarker(verifier, [landmarks] * 3)
         
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         completed, confidence = verifier._verify_expression("unknown_expression", frames)
         
         assert completed is False
@@ -2046,33 +1597,9 @@ class TestVerifyExpression:
         return landmarks
     
     @staticmethod
-    def _mock_face_landmarker(verifier, mocker, landmark_sequence):
+    def _mock_face_landmarker(verifier, landmark_sequence):
         """Helper to mock face landmarker with landmark sequence"""
-        mock_landmarker = mocker.MagicMock()
-        
-        def mock_detect(mp_image):
-            if not hasattr(mock_detect, 'call_count'):
-                mock_detect.call_count = 0
-            
-            idx = mock_detect.call_count % len(landmark_sequence)
-            mock_detect.call_count += 1
-            
-            landmarks = landmark_sequence[idx]
-            
-            mock_face_landmarks = []
-            for x, y, z in landmarks:
-                mock_landmark = mocker.MagicMock()
-                mock_landmark.x = float(x)
-                mock_landmark.y = float(y)
-                mock_landmark.z = float(z)
-                mock_face_landmarks.append(mock_landmark)
-            
-            mock_result = mocker.MagicMock()
-            mock_result.face_landmarks = [mock_face_landmarks]
-            return mock_result
-        
-        mock_landmarker.detect = mock_detect
-        verifier._face_landmarker = mock_landmarker
+        verifier._face_landmarker = _sequence_landmarker(landmark_sequence)
 
 
 # Property-Based Tests
@@ -2094,7 +1621,7 @@ class TestLivenessScorePropertyTests:
         suppress_health_check=[HealthCheck.function_scoped_fixture]  # Allow mocker fixture
     )
     @pytest.mark.property_test
-    def test_property_5_liveness_score_range_validity(self, depth_score, movement_score, mocker):
+    def test_property_5_liveness_score_range_validity(self, depth_score, movement_score, mocker, blank_frame):
         """
         **Validates: Requirements 3.4**
         
@@ -2125,24 +1652,11 @@ class TestLivenessScorePropertyTests:
         base_landmarks[291] = [0.6, 0.65, 0.015] # Right mouth
         
         # Mock the face_landmarker
-        mock_landmarker = mocker.MagicMock()
-        mock_result = mocker.MagicMock()
-        
-        # Create mock landmarks with MediaPipe structure
-        mock_face_landmarks = []
-        for x, y, z in base_landmarks:
-            mock_landmark = mocker.MagicMock()
-            mock_landmark.x = float(x)
-            mock_landmark.y = float(y)
-            mock_landmark.z = float(z)
-            mock_face_landmarks.append(mock_landmark)
-        
-        mock_result.face_landmarks = [mock_face_landmarks]
-        mock_landmarker.detect.return_value = mock_result
-        verifier._face_landmarker = mock_landmarker
+        result = _detection_result(base_landmarks)
+        verifier._face_landmarker = _fake_landmarker(lambda mp_image: result)
         
         # Create test frames
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         
         # Compute liveness score
         score = verifier.compute_liveness_score(frames)
@@ -2176,7 +1690,7 @@ class TestChallengeCompletionPropertyTests:
     )
     @pytest.mark.property_test
     def test_property_6_challenge_completion_recording(
-        self, challenge_type, gesture, expression, completed, confidence, mocker
+        self, challenge_type, gesture, expression, completed, confidence, mocker, blank_frame
     ):
         """
         **Validates: Requirements 4.3**
@@ -2214,7 +1728,7 @@ class TestChallengeCompletionPropertyTests:
             mocker.patch.object(verifier, '_verify_expression', return_value=(completed, confidence))
         
         # Create test frames
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = _frame_views(blank_frame, 3)
         
         # Record time before verification
         time_before = time.time()
@@ -279,7 +279,9 @@ class TestSecurityScenarios:
 
 def create_test_frame():
     """Create a test video frame"""
-    frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+    # Flat background: the flow only needs a deterministic face-like frame,
+    # and random noise exercises nothing extra downstream
+    frame = np.full((480, 640, 3), 150, dtype=np.uint8)
     # Add some structure to make it look more like a face
     cv2.circle(frame, (320, 240), 100, (255, 200, 150), -1)  # Face
     cv2.circle(frame, (280, 220), 20, (50, 50, 50), -1)  # Left eye
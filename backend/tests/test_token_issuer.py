@@ -271,9 +271,32 @@ class TestTokenIssuer:
         # Token issued by issuer1 should be valid for issuer2
         token = issuer1.issue_jwt_token("user", "session", 0.85)
         validation = issuer2.validate_token(token)
-        
+
         assert validation.valid is True
 
+    def test_token_matches_pyjwt_encoding(self, monkeypatch):
+        """Test that the precomputed-header encoder emits the same token as PyJWT"""
+        fixed_time = 1700000000.25
+        monkeypatch.setattr(time, "time", lambda: fixed_time)
+
+        token = self.issuer.issue_jwt_token("user123", "session456", 0.85)
+
+        expected = jwt.encode(
+            {
+                "sub": "user123",
+                "session_id": "session456",
+                "final_score": 0.85,
+                "iat": fixed_time,
+                "exp": fixed_time + 15 * 60,
+                "iss": "proof-of-life-auth"
+            },
+            self.issuer.private_key,
+            algorithm="RS256"
+        )
+
+        assert token == expected
+        assert jwt.get_unverified_header(token) == {"alg": "RS256", "typ": "JWT"}
+
 
 # Property-Based Tests
 from hypothesis import given, strategies as st, settings